@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_, distinct
 from datetime import datetime, timedelta
+from operator import itemgetter
 
 from app.core.database import get_async_session
 from app.core.deps import get_current_active_user
@@ -254,7 +255,7 @@ async def get_commits_analytics(
         })
     
     # 按key排序
-    data_list.sort(key=lambda x: x['key'])
+    data_list.sort(key=itemgetter('key'))
     
     return CommitsAnalyticsResponse(
         total_commits=len(commits),
@@ -365,7 +366,7 @@ async def get_merge_requests_analytics(
     
     # 转换为列表格式并排序
     data_list = list(daily_data.values())
-    data_list.sort(key=lambda x: x['date'])
+    data_list.sort(key=itemgetter('date'))
     
     return MergeRequestsAnalyticsResponse(
         total_merge_requests=len(merge_requests),
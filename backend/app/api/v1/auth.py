@@ -13,6 +13,7 @@ from app.core.security import (
     create_refresh_token,
     verify_password,
     get_password_hash,
+    password_needs_rehash,
     verify_token,
     validate_password_strength
 )
@@ -133,6 +134,11 @@ async def login(
             detail="用户账户已被禁用"
         )
     
+    # 旧的bcrypt哈希在登录成功后升级为argon2id
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = get_password_hash(user_data.password)
+        await db.commit()
+    
     # 创建访问令牌和刷新令牌
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     refresh_token_expires = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
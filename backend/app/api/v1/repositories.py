@@ -1,5 +1,6 @@
 from typing import Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
 from sqlalchemy.orm import selectinload
@@ -15,6 +16,9 @@ from app.schemas.repository import (
     RepositoryUpdate,
     RepositoryResponse,
     RepositoryListResponse,
+    RepositoryBatchCreate,
+    RepositoryBatchItemResult,
+    RepositoryBatchResponse,
     CommitResponse,
     MergeRequestResponse
 )
@@ -23,6 +27,59 @@ import re
 
 router = APIRouter()
 
+# 分页游标通过响应头返回，保持列表响应体结构不变
+HAS_NEXT_HEADER = "X-Has-Next"
+NEXT_BEFORE_DATE_HEADER = "X-Next-Before-Date"
+NEXT_BEFORE_ID_HEADER = "X-Next-Before-Id"
+PAGINATION_HEADERS = [HAS_NEXT_HEADER, NEXT_BEFORE_DATE_HEADER, NEXT_BEFORE_ID_HEADER]
+
+
+def apply_keyset_pagination(query, date_column, id_column, page: int, per_page: int,
+                            before_date: Optional[datetime], before_id: Optional[int]):
+    """
+    按(时间, ID)倒序分页
+    
+    传入上一页最后一条记录的时间和ID作为游标时使用keyset查询，
+    避免OFFSET随页码增大而线性变慢；未传游标时回退到页码分页。
+    多取一条记录用于判断是否还有下一页，见set_next_cursor。
+    """
+    if (before_date is None) != (before_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="before_date 和 before_id 必须同时提供"
+        )
+    
+    query = query.order_by(date_column.desc(), id_column.desc())
+    
+    if before_date is not None:
+        query = query.where(
+            or_(
+                date_column < before_date,
+                and_(date_column == before_date, id_column < before_id)
+            )
+        )
+    else:
+        query = query.offset((page - 1) * per_page)
+    
+    return query.limit(per_page + 1)
+
+
+def set_next_cursor(response: Response, items: list, per_page: int, date_attr: str) -> list:
+    """
+    截掉多取的一条记录，并在响应头中写入下一页游标
+    
+    X-Has-Next 为 true 时，将 X-Next-Before-Date 和 X-Next-Before-Id
+    原样作为 before_date、before_id 查询参数即可获取下一页。
+    """
+    has_next = len(items) > per_page
+    items = items[:per_page]
+    response.headers[HAS_NEXT_HEADER] = "true" if has_next else "false"
+    if has_next:
+        last = items[-1]
+        response.headers[NEXT_BEFORE_DATE_HEADER] = getattr(last, date_attr).isoformat()
+        response.headers[NEXT_BEFORE_ID_HEADER] = str(last.id)
+    return items
+
 
 @router.get("", response_model=RepositoryListResponse)
 @router.get("/", response_model=RepositoryListResponse)
@@ -62,17 +119,21 @@ async def get_repositories(
     # 排序
     query = query.order_by(Repository.created_at.desc())
     
-    # 计算总数
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
-    
-    # 分页
+    # 分页，总数通过窗口函数随分页结果一并返回
     offset = (page - 1) * per_page
-    query = query.offset(offset).limit(per_page)
+    paged_query = query.add_columns(func.count().over().label('total')).offset(offset).limit(per_page)
     
-    result = await db.execute(query)
-    repositories = result.scalars().all()
+    result = await db.execute(paged_query)
+    rows = result.all()
+    repositories = [row[0] for row in rows]
+    
+    if rows:
+        total = rows[0].total
+    else:
+        # 页码超出范围时窗口函数没有返回行，单独计算总数
+        count_query = select(func.count()).select_from(query.subquery())
+        total_result = await db.execute(count_query)
+        total = total_result.scalar()
     
     # 获取统计信息
     repositories_data = []
@@ -162,6 +223,68 @@ async def create_repository(
     return RepositoryResponse(**repo_dict)
 
 
+@router.post("/batch", response_model=RepositoryBatchResponse)
+async def create_repositories_batch(
+    batch_data: RepositoryBatchCreate,
+    db: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_active_user)
+) -> Any:
+    """
+    批量添加仓库
+
+    逐项返回结果（201成功、400URL无效、409已存在），所有新仓库在同一事务中写入
+    """
+    # 一次查询取出本批次中已存在的URL
+    urls = {item.url for item in batch_data.repositories}
+    existing_query = select(Repository.url).where(
+        and_(
+            Repository.user_id == current_user.id,
+            Repository.url.in_(urls)
+        )
+    )
+    seen_urls = set((await db.execute(existing_query)).scalars().all())
+
+    results = []
+    created = []
+    for item in batch_data.repositories:
+        url_validation = validate_git_url(item.url)
+        if not url_validation['valid']:
+            results.append(RepositoryBatchItemResult(
+                status=status.HTTP_400_BAD_REQUEST,
+                error=url_validation['message']
+            ))
+            continue
+        # 与已有仓库或本批次前面的项重复
+        if item.url in seen_urls:
+            results.append(RepositoryBatchItemResult(
+                status=status.HTTP_409_CONFLICT,
+                error="该仓库已存在"
+            ))
+            continue
+        seen_urls.add(item.url)
+
+        repository = Repository(
+            user_id=current_user.id,
+            name=item.name,
+            url=item.url,
+            platform=item.platform,
+            project_id=item.project_id,
+            api_key_encrypted=item.api_key  # 暂时不加密存储
+        )
+        db.add(repository)
+        created.append((len(results), repository))
+        results.append(RepositoryBatchItemResult(status=status.HTTP_201_CREATED))
+
+    if created:
+        # flush后即可拿到自增ID，整批只提交一次
+        await db.flush()
+        for index, repository in created:
+            results[index].id = repository.id
+        await db.commit()
+
+    return RepositoryBatchResponse(items=results, created=len(created))
+
+
 @router.get("/{repo_id}", response_model=RepositoryResponse)
 async def get_repository(
     repo_id: int,
@@ -295,13 +418,18 @@ async def delete_repository(
 @router.get("/{repo_id}/commits", response_model=list[CommitResponse])
 async def get_repository_commits(
     repo_id: int,
+    response: Response,
     db: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(get_current_active_user),
     page: int = Query(1, ge=1, description="页码"),
-    per_page: int = Query(20, ge=1, le=100, description="每页数量")
+    per_page: int = Query(20, ge=1, le=100, description="每页数量"),
+    before_date: Optional[datetime] = Query(None, description="游标：上一页最后一条提交的时间"),
+    before_id: Optional[int] = Query(None, description="游标：上一页最后一条提交的ID")
 ) -> Any:
     """
     获取仓库的提交记录
+    
+    下一页游标见响应头 X-Has-Next / X-Next-Before-Date / X-Next-Before-Id
     """
     # 验证仓库权限
     repo_query = select(Repository).where(
@@ -318,13 +446,13 @@ async def get_repository_commits(
         )
     
     # 获取提交记录
-    offset = (page - 1) * per_page
-    commits_query = select(Commit).where(
-        Commit.repository_id == repo_id
-    ).order_by(Commit.commit_date.desc()).offset(offset).limit(per_page)
+    commits_query = apply_keyset_pagination(
+        select(Commit).where(Commit.repository_id == repo_id),
+        Commit.commit_date, Commit.id, page, per_page, before_date, before_id
+    )
     
     result = await db.execute(commits_query)
-    commits = result.scalars().all()
+    commits = set_next_cursor(response, result.scalars().all(), per_page, 'commit_date')
     
     return [CommitResponse(**commit.to_dict()) for commit in commits]
 
@@ -332,14 +460,19 @@ async def get_repository_commits(
 @router.get("/{repo_id}/merge-requests", response_model=list[MergeRequestResponse])
 async def get_repository_merge_requests(
     repo_id: int,
+    response: Response,
     db: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(get_current_active_user),
     page: int = Query(1, ge=1, description="页码"),
     per_page: int = Query(20, ge=1, le=100, description="每页数量"),
-    status_filter: Optional[str] = Query(None, description="状态筛选")
+    status_filter: Optional[str] = Query(None, description="状态筛选"),
+    before_date: Optional[datetime] = Query(None, description="游标：上一页最后一条合并请求的创建时间"),
+    before_id: Optional[int] = Query(None, description="游标：上一页最后一条合并请求的ID")
 ) -> Any:
     """
     获取仓库的合并请求
+    
+    下一页游标见响应头 X-Has-Next / X-Next-Before-Date / X-Next-Before-Id
     """
     # 验证仓库权限
     repo_query = select(Repository).where(
@@ -362,10 +495,12 @@ async def get_repository_merge_requests(
         query = query.where(MergeRequest.status == status_filter)
     
     # 分页
-    offset = (page - 1) * per_page
-    query = query.order_by(MergeRequest.created_date.desc()).offset(offset).limit(per_page)
+    query = apply_keyset_pagination(
+        query, MergeRequest.created_date, MergeRequest.id,
+        page, per_page, before_date, before_id
+    )
     
     result = await db.execute(query)
-    merge_requests = result.scalars().all()
+    merge_requests = set_next_cursor(response, result.scalars().all(), per_page, 'created_date')
     
     return [MergeRequestResponse(**mr.to_dict()) for mr in merge_requests]
\ No newline at end of file
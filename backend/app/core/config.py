@@ -28,6 +28,8 @@ class Settings(BaseSettings):
         "DATABASE_URL", 
         "sqlite:///./app.db"
     )
+    # SQL echo logs every statement; only enable it for local debugging
+    SQLALCHEMY_ECHO: bool = False
     
     # CORS
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = [
@@ -17,7 +17,7 @@ if database_url.startswith("sqlite://"):
 # Create async engine
 engine = create_async_engine(
     database_url,
-    echo=True,  # Set to False in production
+    echo=settings.SQLALCHEMY_ECHO,
     future=True
 )
 
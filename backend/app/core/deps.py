@@ -26,17 +26,14 @@ async def get_current_user(
     
     # Verify token
     user_id = verify_token(credentials.credentials)
-    if user_id is None:
+    if user_id is None or not user_id.isdecimal():
         raise credentials_exception
     
     # Get user from database
-    try:
-        result = await session.execute(
-            select(User).where(User.id == int(user_id))
-        )
-        user = result.scalar_one_or_none()
-    except ValueError:
-        raise credentials_exception
+    result = await session.execute(
+        select(User).where(User.id == int(user_id))
+    )
+    user = result.scalar_one_or_none()
     
     if user is None:
         raise credentials_exception
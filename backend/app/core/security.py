@@ -8,7 +8,16 @@ from app.core.config import settings
 
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# argon2id is the default scheme; bcrypt stays verifiable for existing hashes
+# and is flagged as deprecated so they get upgraded on next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=64 * 1024,
+    argon2__parallelism=1,
+)
 
 
 def create_access_token(
@@ -71,6 +80,11 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a stored hash uses a deprecated scheme or parameters"""
+    return pwd_context.needs_update(hashed_password)
+
+
 def validate_password(password: str) -> bool:
     """Validate password strength"""
     if len(password) < 8:
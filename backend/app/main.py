@@ -1,8 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from app.core.config import settings
 from app.api.v1 import api_router
+from app.api.v1.repositories import PAGINATION_HEADERS
 from app.core.database import engine
 from app.models import Base
 
@@ -21,6 +23,7 @@ app = FastAPI(
     description="Git仓库管理和数据分析平台API",
     version="1.0.0",
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -31,6 +34,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=PAGINATION_HEADERS,
 )
 
 # 包含API路由
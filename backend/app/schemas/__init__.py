@@ -14,6 +14,9 @@ from .repository import (
     RepositoryStats,
     RepositoryResponse,
     RepositoryListResponse,
+    RepositoryBatchCreate,
+    RepositoryBatchItemResult,
+    RepositoryBatchResponse,
     CommitBase,
     CommitResponse,
     MergeRequestBase,
@@ -45,6 +48,9 @@ __all__ = [
     "RepositoryStats",
     "RepositoryResponse",
     "RepositoryListResponse",
+    "RepositoryBatchCreate",
+    "RepositoryBatchItemResult",
+    "RepositoryBatchResponse",
     "CommitBase",
     "CommitResponse",
     "MergeRequestBase",
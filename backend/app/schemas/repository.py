@@ -56,6 +56,24 @@ class RepositoryListResponse(BaseModel):
     pages: int
 
 
+class RepositoryBatchCreate(BaseModel):
+    """批量创建仓库模式"""
+    repositories: list[RepositoryCreate] = Field(..., min_length=1, max_length=100, description="待创建的仓库列表")
+
+
+class RepositoryBatchItemResult(BaseModel):
+    """批量创建单项结果模式"""
+    status: int = Field(..., description="该项的HTTP状态码")
+    id: Optional[int] = Field(None, description="创建成功时的仓库ID")
+    error: Optional[str] = Field(None, description="创建失败时的错误信息")
+
+
+class RepositoryBatchResponse(BaseModel):
+    """批量创建仓库响应模式"""
+    items: list[RepositoryBatchItemResult]
+    created: int = Field(..., description="成功创建的数量")
+
+
 class CommitBase(BaseModel):
     """提交基础模式"""
     commit_hash: str = Field(..., description="提交哈希")
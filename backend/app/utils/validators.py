@@ -5,9 +5,53 @@
 """
 
 import re
+import string
+from datetime import date
 from urllib.parse import urlparse
 from typing import Optional, Dict, Any
 
+# 预编译的正则表达式，避免每次调用时查找re模块的编译缓存
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# 常见弱密码模式合并为一个忽略大小写的分支表达式，一次扫描完成检查
+_PW_WEAK_RE = re.compile(r'123456|password|admin|qwerty|abc123|111111|000000', re.IGNORECASE)
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+_SSH_GIT_RE = re.compile(r'^git@([a-zA-Z0-9.-]+):([a-zA-Z0-9._/-]+)\.git$')
+_PROJECT_NAME_RE = re.compile(r'^[a-zA-Z0-9\u4e00-\u9fa5_\s-]+$')
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}\Z')
+_MIN_DATE = date(2000, 1, 1)
+
+# 预先绑定正则方法，热点路径中省去每次调用的属性查找
+_match_email = _EMAIL_RE.match
+_search_weak_password = _PW_WEAK_RE.search
+_match_username = _USERNAME_RE.match
+_match_ssh_git = _SSH_GIT_RE.match
+_match_project_name = _PROJECT_NAME_RE.match
+_match_date = _DATE_RE.match
+
+# 域名标签允许的字符
+_DOMAIN_LABEL_CHARS = frozenset(string.ascii_letters + string.digits + '-')
+
+# 系统保留用户名
+_RESERVED_USERNAMES = frozenset({
+    'admin', 'root', 'system', 'api', 'www', 'mail', 'ftp',
+    'test', 'guest', 'anonymous', 'null', 'undefined'
+})
+
+# 支持的Git平台域名
+_GIT_PLATFORMS = frozenset({
+    'github.com',
+    'gitlab.com',
+    'codeup.aliyun.com',
+    'gitee.com',
+    'bitbucket.org'
+})
+
+# 密码字符类别，用集合运算代替逐个正则扫描
+_PW_LOWER_CHARS = frozenset(string.ascii_lowercase)
+_PW_UPPER_CHARS = frozenset(string.ascii_uppercase)
+_PW_DIGIT_CHARS = frozenset(string.digits)
+_PW_SPECIAL_CHARS = frozenset('!@#$%^&*()_+-=[]{};:\'"\\|,.<>/?')
+
 def validate_email(email: str) -> Dict[str, Any]:
     """
     验证邮箱格式
@@ -28,18 +72,17 @@ def validate_email(email: str) -> Dict[str, Any]:
     if len(email) < 5 or len(email) > 254:
         return {'valid': False, 'message': '邮箱长度必须在5-254个字符之间'}
     
-    # 正则表达式验证
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
-    if not re.match(email_pattern, email):
+    # 检查@符号数量：必须恰好一个且不在开头（find命中即返回，无需全串计数）
+    at_index = email.find('@')
+    if at_index < 1 or email.find('@', at_index + 1) != -1:
         return {'valid': False, 'message': '邮箱格式不正确'}
     
     # 检查是否有连续的点
     if '..' in email:
         return {'valid': False, 'message': '邮箱格式不正确'}
     
-    # 检查@符号数量
-    if email.count('@') != 1:
+    # 廉价检查通过后再进行正则表达式验证
+    if not _match_email(email):
         return {'valid': False, 'message': '邮箱格式不正确'}
     
     return {'valid': True, 'message': '邮箱格式正确'}
@@ -68,6 +111,9 @@ def validate_password(password: str) -> Dict[str, Any]:
     strength_score = 0
     strength_messages = []
     
+    # 密码中出现的字符集合，供下面各类字符检查共用
+    chars = set(password)
+    
     # 检查长度
     if len(password) >= 8:
         strength_score += 1
@@ -75,45 +121,33 @@ def validate_password(password: str) -> Dict[str, Any]:
         strength_messages.append('建议密码长度至少8个字符')
     
     # 检查是否包含小写字母
-    if re.search(r'[a-z]', password):
+    if not _PW_LOWER_CHARS.isdisjoint(chars):
         strength_score += 1
     else:
         strength_messages.append('建议包含小写字母')
     
     # 检查是否包含大写字母
-    if re.search(r'[A-Z]', password):
+    if not _PW_UPPER_CHARS.isdisjoint(chars):
         strength_score += 1
     else:
         strength_messages.append('建议包含大写字母')
     
     # 检查是否包含数字
-    if re.search(r'\d', password):
+    if not _PW_DIGIT_CHARS.isdisjoint(chars) or any(map(str.isdecimal, chars)):
         strength_score += 1
     else:
         strength_messages.append('建议包含数字')
     
     # 检查是否包含特殊字符
-    if re.search(r'[!@#$%^&*()_+\-=\[\]{};:\'"\\|,.<>\/?]', password):
+    if not _PW_SPECIAL_CHARS.isdisjoint(chars):
         strength_score += 1
     else:
         strength_messages.append('建议包含特殊字符')
     
     # 检查是否包含常见弱密码模式
-    weak_patterns = [
-        r'123456',
-        r'password',
-        r'admin',
-        r'qwerty',
-        r'abc123',
-        r'111111',
-        r'000000'
-    ]
-    
-    for pattern in weak_patterns:
-        if re.search(pattern, password.lower()):
-            strength_score -= 2
-            strength_messages.append('避免使用常见密码模式')
-            break
+    if _search_weak_password(password):
+        strength_score -= 2
+        strength_messages.append('避免使用常见密码模式')
     
     # 确定强度等级
     if strength_score >= 4:
@@ -121,10 +155,10 @@ def validate_password(password: str) -> Dict[str, Any]:
         message = '密码强度良好'
     elif strength_score >= 2:
         strength = 'medium'
-        message = '密码强度中等，' + '，'.join(strength_messages[:2])
+        message = f"密码强度中等，{'，'.join(strength_messages[:2])}"
     else:
         strength = 'weak'
-        message = '密码强度较弱，' + '，'.join(strength_messages[:3])
+        message = f"密码强度较弱，{'，'.join(strength_messages[:3])}"
     
     return {
         'valid': True,
@@ -158,7 +192,7 @@ def validate_username(username: str) -> Dict[str, Any]:
         return {'valid': False, 'message': '用户名长度不能超过50个字符'}
     
     # 格式检查：只允许字母、数字、下划线、连字符
-    if not re.match(r'^[a-zA-Z0-9_-]+$', username):
+    if not _match_username(username):
         return {'valid': False, 'message': '用户名只能包含字母、数字、下划线和连字符'}
     
     # 不能以数字开头
@@ -170,16 +204,21 @@ def validate_username(username: str) -> Dict[str, Any]:
         return {'valid': False, 'message': '用户名不能全是数字'}
     
     # 保留用户名检查
-    reserved_usernames = [
-        'admin', 'root', 'system', 'api', 'www', 'mail', 'ftp',
-        'test', 'guest', 'anonymous', 'null', 'undefined'
-    ]
-    
-    if username.lower() in reserved_usernames:
+    if username.lower() in _RESERVED_USERNAMES:
         return {'valid': False, 'message': '该用户名为系统保留，请选择其他用户名'}
     
     return {'valid': True, 'message': '用户名格式正确'}
 
+def _is_valid_domain(domain: str) -> bool:
+    """
+    逐个标签检查域名：每段1-63个字母、数字或连字符，且不以连字符开头或结尾
+    """
+    for label in domain.split('.'):
+        if (not label or len(label) > 63 or label[0] == '-' or label[-1] == '-'
+                or not _DOMAIN_LABEL_CHARS.issuperset(label)):
+            return False
+    return True
+
 def validate_url(url: str) -> Dict[str, Any]:
     """
     验证URL格式
@@ -194,8 +233,12 @@ def validate_url(url: str) -> Dict[str, Any]:
         return {'valid': False, 'message': 'URL不能为空', 'parsed': None}
     
     # 去除首尾空格
-    url = url.strip()
-    
+    return _check_url(url.strip())
+
+def _check_url(url: str) -> Dict[str, Any]:
+    """
+    验证已去除首尾空格的URL，供validate_url与validate_git_url共用
+    """
     # 长度检查
     if len(url) > 2048:
         return {'valid': False, 'message': 'URL长度不能超过2048个字符', 'parsed': None}
@@ -208,20 +251,18 @@ def validate_url(url: str) -> Dict[str, Any]:
         if not parsed.scheme:
             return {'valid': False, 'message': 'URL必须包含协议(http/https)', 'parsed': None}
         
-        if parsed.scheme.lower() not in ['http', 'https']:
+        if parsed.scheme.lower() not in ('http', 'https'):
             return {'valid': False, 'message': 'URL协议必须是http或https', 'parsed': None}
         
         # 检查域名
         if not parsed.netloc:
             return {'valid': False, 'message': 'URL必须包含有效的域名', 'parsed': None}
         
-        # 域名格式检查
-        domain_pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$'
-        
         # 提取域名部分（去除端口）
         domain = parsed.netloc.split(':')[0]
         
-        if not re.match(domain_pattern, domain):
+        # 域名格式检查
+        if not _is_valid_domain(domain):
             return {'valid': False, 'message': 'URL域名格式不正确', 'parsed': None}
         
         return {
@@ -255,58 +296,57 @@ def validate_git_url(url: str) -> Dict[str, Any]:
     
     url = url.strip()
     
-    # 检查是否是HTTPS Git URL
     if url.startswith('https://'):
-        # 验证基本URL格式
-        url_result = validate_url(url)
-        if not url_result['valid']:
-            return {'valid': False, 'message': url_result['message'], 'type': None}
-        
-        # 检查是否以.git结尾
-        if not url.endswith('.git'):
-            return {'valid': False, 'message': 'Git URL应该以.git结尾', 'type': 'https'}
-        
-        # 检查是否是支持的Git平台
-        supported_platforms = [
-            'github.com',
-            'gitlab.com',
-            'codeup.aliyun.com',
-            'gitee.com',
-            'bitbucket.org'
-        ]
-        
-        domain = urlparse(url).netloc.lower()
-        platform_type = None
-        
-        for platform in supported_platforms:
-            if platform in domain:
-                platform_type = platform
-                break
-        
-        return {
-            'valid': True,
-            'message': 'Git URL格式正确',
-            'type': 'https',
-            'platform': platform_type
-        }
-    
-    # 检查是否是SSH Git URL
+        return _validate_https_git_url(url)
     elif url.startswith('git@'):
-        # SSH格式: git@hostname:username/repository.git
-        ssh_pattern = r'^git@([a-zA-Z0-9.-]+):([a-zA-Z0-9._/-]+)\.git$'
-        
-        if not re.match(ssh_pattern, url):
-            return {'valid': False, 'message': 'SSH Git URL格式不正确', 'type': None}
-        
-        return {
-            'valid': True,
-            'message': 'SSH Git URL格式正确',
-            'type': 'ssh'
-        }
-    
+        return _validate_ssh_git_url(url)
     else:
         return {'valid': False, 'message': 'Git URL必须以https://或git@开头', 'type': None}
 
+def _validate_https_git_url(url: str) -> Dict[str, Any]:
+    """
+    验证HTTPS格式的Git URL
+    """
+    # 验证基本URL格式（url已去除首尾空格，直接进入解析）
+    url_result = _check_url(url)
+    if not url_result['valid']:
+        return {'valid': False, 'message': url_result['message'], 'type': None}
+    
+    # 检查是否以.git结尾
+    if not url.endswith('.git'):
+        return {'valid': False, 'message': 'Git URL应该以.git结尾', 'type': 'https'}
+    
+    # 检查是否是支持的Git平台（复用解析结果，按域名精确匹配，兼容子域名）
+    domain = url_result['parsed']['domain'].lower()
+    platform_type = None
+    
+    while domain:
+        if domain in _GIT_PLATFORMS:
+            platform_type = domain
+            break
+        domain = domain.partition('.')[2]
+    
+    return {
+        'valid': True,
+        'message': 'Git URL格式正确',
+        'type': 'https',
+        'platform': platform_type
+    }
+
+def _validate_ssh_git_url(url: str) -> Dict[str, Any]:
+    """
+    验证SSH格式的Git URL: git@hostname:username/repository.git
+    """
+    # 先用后缀和分隔符做廉价预检，只有可能合法的输入才进入正则匹配
+    if not url.endswith('.git') or ':' not in url or not _match_ssh_git(url):
+        return {'valid': False, 'message': 'SSH Git URL格式不正确', 'type': None}
+    
+    return {
+        'valid': True,
+        'message': 'SSH Git URL格式正确',
+        'type': 'ssh'
+    }
+
 def validate_project_name(name: str) -> Dict[str, Any]:
     """
     验证项目名称格式
@@ -330,7 +370,7 @@ def validate_project_name(name: str) -> Dict[str, Any]:
         return {'valid': False, 'message': '项目名称长度不能超过100个字符'}
     
     # 格式检查：允许字母、数字、中文、下划线、连字符、空格
-    if not re.match(r'^[a-zA-Z0-9\u4e00-\u9fa5_\s-]+$', name):
+    if not _match_project_name(name):
         return {'valid': False, 'message': '项目名称只能包含字母、数字、中文、下划线、连字符和空格'}
     
     # 不能全是空格
@@ -339,6 +379,12 @@ def validate_project_name(name: str) -> Dict[str, Any]:
     
     return {'valid': True, 'message': '项目名称格式正确'}
 
+def _parse_ymd(value: str) -> date:
+    """
+    解析已通过格式校验的YYYY-MM-DD字符串，绕过strptime的格式解析开销
+    """
+    return date(int(value[:4]), int(value[5:7]), int(value[8:10]))
+
 def validate_date_range(start_date: Optional[str], end_date: Optional[str]) -> Dict[str, Any]:
     """
     验证日期范围
@@ -350,20 +396,16 @@ def validate_date_range(start_date: Optional[str], end_date: Optional[str]) -> D
     Returns:
         dict: 验证结果 {'valid': bool, 'message': str}
     """
-    from datetime import datetime
-    
     try:
         # 如果都为空，则有效
         if not start_date and not end_date:
             return {'valid': True, 'message': '日期范围有效'}
         
         # 日期格式验证
-        date_pattern = r'^\d{4}-\d{2}-\d{2}$'
-        
-        if start_date and not re.match(date_pattern, start_date):
+        if start_date and not _match_date(start_date):
             return {'valid': False, 'message': '开始日期格式不正确，应为YYYY-MM-DD'}
         
-        if end_date and not re.match(date_pattern, end_date):
+        if end_date and not _match_date(end_date):
             return {'valid': False, 'message': '结束日期格式不正确，应为YYYY-MM-DD'}
         
         # 解析日期
@@ -371,10 +413,10 @@ def validate_date_range(start_date: Optional[str], end_date: Optional[str]) -> D
         end_dt = None
         
         if start_date:
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
+            start_dt = _parse_ymd(start_date)
         
         if end_date:
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+            end_dt = _parse_ymd(end_date)
         
         # 检查日期范围
         if start_dt and end_dt:
@@ -385,14 +427,13 @@ def validate_date_range(start_date: Optional[str], end_date: Optional[str]) -> D
             if (end_dt - start_dt).days > 365:
                 return {'valid': False, 'message': '日期范围不能超过1年'}
         
-        # 检查日期是否在合理范围内
-        current_date = datetime.now()
-        min_date = datetime(2000, 1, 1)
+        # 检查日期是否在合理范围内（只需精确到天）
+        current_date = date.today()
         
-        if start_dt and (start_dt < min_date or start_dt > current_date):
+        if start_dt and (start_dt < _MIN_DATE or start_dt > current_date):
             return {'valid': False, 'message': '开始日期超出有效范围'}
         
-        if end_dt and (end_dt < min_date or end_dt > current_date):
+        if end_dt and (end_dt < _MIN_DATE or end_dt > current_date):
             return {'valid': False, 'message': '结束日期超出有效范围'}
         
         return {'valid': True, 'message': '日期范围有效'}
@@ -5,16 +5,15 @@ import os
 # 添加backend目录到Python路径
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
-from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.core.database import get_async_session
+from app.core.database import AsyncSessionLocal
 from app.models.user import User
 
 async def check_user():
     """检查数据库中的用户"""
     try:
         # 获取数据库会话
-        async for session in get_async_session():
+        async with AsyncSessionLocal() as session:
             # 查询所有用户
             result = await session.execute(select(User))
             users = result.scalars().all()
@@ -23,9 +22,8 @@ async def check_user():
             for user in users:
                 print(f"- ID: {user.id}, 用户名: {user.username}, 邮箱: {user.email}, 激活状态: {user.is_active}")
             
-            # 特别检查ID为1的用户
-            result = await session.execute(select(User).where(User.id == 1))
-            user_1 = result.scalar_one_or_none()
+            # 特别检查ID为1的用户（直接在已查出的用户中查找，不再额外查询）
+            user_1 = next((user for user in users if user.id == 1), None)
             
             if user_1:
                 print(f"\nID为1的用户详情:")
@@ -37,8 +35,6 @@ async def check_user():
             else:
                 print("\n❌ 数据库中不存在ID为1的用户！")
             
-            break
-            
     except Exception as e:
         print(f"❌ 检查用户时出错: {e}")
         import traceback
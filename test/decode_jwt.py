@@ -1,28 +1,22 @@
 import base64
-import json
+
+import orjson
 
 def decode_jwt_payload(token):
     """解码JWT token的payload部分"""
     try:
-        # JWT token由三部分组成，用.分隔
-        parts = token.split('.')
-        if len(parts) != 3:
+        # JWT token由三部分组成，用.分隔，只切出payload部分（第二部分）
+        _, _, rest = token.partition('.')
+        payload, sep, signature = rest.partition('.')
+        if not sep or '.' in signature:
             return None
         
-        # 获取payload部分（第二部分）
-        payload = parts[1]
-        
-        # 添加必要的padding
-        padding = 4 - len(payload) % 4
-        if padding != 4:
-            payload += '=' * padding
-        
-        # Base64解码
-        decoded_bytes = base64.urlsafe_b64decode(payload)
-        decoded_str = decoded_bytes.decode('utf-8')
+        # 添加必要的padding后Base64解码
+        payload = payload.encode('ascii')
+        decoded_bytes = base64.urlsafe_b64decode(payload + b'=' * (-len(payload) % 4))
         
-        # 解析JSON
-        payload_data = json.loads(decoded_str)
+        # 解析JSON（orjson直接接收bytes）
+        payload_data = orjson.loads(decoded_bytes)
         return payload_data
     except Exception as e:
         print(f"解码错误: {e}")
@@ -35,7 +29,7 @@ if __name__ == "__main__":
     payload = decode_jwt_payload(token)
     if payload:
         print("JWT Payload:")
-        print(json.dumps(payload, indent=2, ensure_ascii=False))
+        print(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
         print(f"\nUser ID (sub): {payload.get('sub')}")
         print(f"User ID type: {type(payload.get('sub'))}")
     else:
@@ -5,7 +5,7 @@ import os
 # 添加backend目录到Python路径
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
-from app.core.database import create_tables, get_async_session
+from app.core.database import create_tables, AsyncSessionLocal
 from app.models.user import User
 from app.core.security import get_password_hash
 from sqlalchemy import select
@@ -18,7 +18,7 @@ async def init_database():
         print("✅ 数据库表创建成功")
         
         # 创建测试用户
-        async for session in get_async_session():
+        async with AsyncSessionLocal() as session:
             # 检查是否已存在测试用户
             result = await session.execute(select(User).where(User.username == "testuser"))
             existing_user = result.scalar_one_or_none()
@@ -48,8 +48,6 @@ async def init_database():
             for user in users:
                 print(f"- ID: {user.id}, 用户名: {user.username}, 邮箱: {user.email}, 激活状态: {user.is_active}")
             
-            break
-            
     except Exception as e:
         print(f"❌ 初始化数据库时出错: {e}")
         import traceback
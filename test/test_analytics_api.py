@@ -5,30 +5,107 @@
 测试所有数据分析、报表生成等功能接口
 """
 
-import requests
-import json
+import asyncio
+import aiohttp
+import itertools
+import orjson
+import sys
 import time
+from contextvars import ContextVar
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+# 网关类错误（502/503/504）按指数退避重试，仅重试幂等方法
+_RETRY_STATUS_CODES = frozenset({502, 503, 504})
+_RETRY_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+_MAX_RETRIES = 2
+_RETRY_BACKOFF_FACTOR = 0.2
+
+# 测试结果序列化选项：允许非字符串键；结果文件紧凑输出，便于阅读的场景再加缩进
+_JSON_DUMP_OPTIONS = orjson.OPT_NON_STR_KEYS
+_JSON_PRETTY_OPTIONS = _JSON_DUMP_OPTIONS | orjson.OPT_INDENT_2
+
+# 非JSON错误响应最多保留的字符数
+_ERROR_TEXT_LIMIT = 2000
+
+# 各测试组并发运行时，每组的控制台输出和测试结果先写入本组自己的缓冲
+_phase_lines: ContextVar[Optional[List[str]]] = ContextVar('_phase_lines', default=None)
+_phase_results: ContextVar[Optional[List[Dict]]] = ContextVar('_phase_results', default=None)
+
+class APIResponse(NamedTuple):
+    """
+    已读取并解析过的响应
+    """
+    status: int
+    payload: Any  # 解析后的JSON；空响应体为空字符串，非JSON响应体为截断后的原始文本
+
+def _decode_body(body: bytes) -> Any:
+    """
+    解析响应体，非JSON响应（如网关或服务器的纯文本、HTML错误页）返回原始文本
+    
+    Args:
+        body: 响应体字节
+        
+    Returns:
+        解析后的JSON或原始文本
+    """
+    if not body:
+        return ''
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return body.decode('utf-8', errors='replace')[:_ERROR_TEXT_LIMIT]
 
 class AnalyticsAPITester:
     """
     分析统计API测试类
     """
     
-    def __init__(self, base_url: str = "http://localhost:5001"):
+    def __init__(self, base_url: str = "http://localhost:5001", cache_enabled: bool = True,
+                 verbose: bool = False):
         """
         初始化测试器
         
         Args:
             base_url: API基础URL
+            cache_enabled: 是否缓存分析接口的GET响应
+            verbose: 是否在控制台输出每条测试的详细信息
         """
         self.base_url = base_url
-        self.session = requests.Session()
+        self.cache_enabled = cache_enabled
+        self.verbose = verbose
+        self._pending_lines: List[str] = []
+        self._response_cache: Dict[tuple, APIResponse] = {}
+        self.session: Optional[aiohttp.ClientSession] = None
         self.access_token = None
         self.test_results = []
+        # 记录结果时只取单调时钟差值，保存时再统一换算成墙上时间
+        self._t0_ns = time.monotonic_ns()
+        self._t0_wall = datetime.now()
         self.test_user_id = None
         self.test_repo_ids = []
+        self.test_repo_ids_param = ''
+    
+    async def __aenter__(self):
+        """
+        创建复用连接的HTTP会话
+        """
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=10),
+            headers={
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            }
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """
+        关闭HTTP会话
+        """
+        await self.session.close()
         
     def log_test(self, test_name: str, success: bool, message: str, details: Optional[Dict] = None):
         """
@@ -45,19 +122,52 @@ class AnalyticsAPITester:
             'success': success,
             'message': message,
             'details': details,
-            'timestamp': datetime.now().isoformat()
+            'ts_ns': time.monotonic_ns() - self._t0_ns
         }
-        self.test_results.append(result)
+        results = _phase_results.get()
+        (self.test_results if results is None else results).append(result)
         
         status = "✅ 成功" if success else "❌ 失败"
-        print(f"{status} - {test_name}: {message}")
-        if details and success:
-            print(f"   详细信息: {json.dumps(details, ensure_ascii=False, indent=2)}")
-        elif details and not success:
-            print(f"   错误详情: {json.dumps(details, ensure_ascii=False, indent=2)}")
+        self.emit(f"{status} - {test_name}: {message}")
+        if details and self.verbose:
+            label = "详细信息" if success else "错误详情"
+            self.emit(f"   {label}: {orjson.dumps(details, option=_JSON_PRETTY_OPTIONS).decode()}")
     
-    def make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
-                    params: Optional[Dict] = None) -> requests.Response:
+    def emit(self, line: str):
+        """
+        缓冲一行控制台输出，由flush_output统一写出
+        """
+        lines = _phase_lines.get()
+        (self._pending_lines if lines is None else lines).append(line)
+    
+    async def run_phase(self, title: str, test) -> Tuple[List[str], List[Dict]]:
+        """
+        运行一组测试
+        
+        Args:
+            title: 测试组标题
+            test: 测试组协程函数
+            
+        Returns:
+            该组的控制台输出和测试结果，保证各组输出和结果顺序不受完成先后影响
+        """
+        lines = [f"\n=== {title} ==="]
+        results = []
+        _phase_lines.set(lines)
+        _phase_results.set(results)
+        await test()
+        return lines, results
+    
+    def flush_output(self):
+        """
+        一次性写出缓冲的控制台输出
+        """
+        if self._pending_lines:
+            sys.stdout.write('\n'.join(self._pending_lines) + '\n')
+            self._pending_lines.clear()
+    
+    async def make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
+                          params: Optional[Dict] = None) -> APIResponse:
         """
         发送HTTP请求
         
@@ -68,35 +178,61 @@ class AnalyticsAPITester:
             params: 查询参数
             
         Returns:
-            响应对象
+            状态码及解析后的响应体
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
+        # 通用请求头和认证头都已设置在会话上
+        url = self.base_url + endpoint
+        method = method.upper()
         
-        if self.access_token:
-            headers['Authorization'] = f'Bearer {self.access_token}'
+        # 分析接口的GET响应在一次测试运行内不变，相同参数直接复用
+        cache_key = None
+        if self.cache_enabled and method == 'GET' and endpoint.startswith('/api/analytics/'):
+            cache_key = (endpoint, tuple(sorted((params or {}).items())))
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
         
+        max_retries = _MAX_RETRIES if method in _RETRY_METHODS else 0
         try:
-            if method.upper() == 'GET':
-                response = self.session.get(url, headers=headers, params=params, timeout=10)
-            elif method.upper() == 'POST':
-                response = self.session.post(url, headers=headers, json=data, params=params, timeout=10)
-            elif method.upper() == 'PUT':
-                response = self.session.put(url, headers=headers, json=data, params=params, timeout=10)
-            elif method.upper() == 'DELETE':
-                response = self.session.delete(url, headers=headers, params=params, timeout=10)
-            else:
-                raise ValueError(f"不支持的HTTP方法: {method}")
-            
-            return response
-        except requests.exceptions.RequestException as e:
-            print(f"请求异常: {e}")
+            for attempt in range(max_retries + 1):
+                async with self.session.request(method, url, json=data, params=params) as response:
+                    # 在连接归还连接池前读完响应体
+                    status = response.status
+                    body = await response.read()
+                
+                if status not in _RETRY_STATUS_CODES or attempt == max_retries:
+                    # 响应体只解析一次，调用方和缓存共用解析结果
+                    result = APIResponse(status, _decode_body(body))
+                    if cache_key is not None and status == 200:
+                        self._response_cache[cache_key] = result
+                    return result
+                await asyncio.sleep(_RETRY_BACKOFF_FACTOR * (2 ** attempt))
+        except aiohttp.ClientError as e:
+            self.emit(f"请求异常: {e}")
             raise
+        except asyncio.TimeoutError as e:
+            # 超时异常没有消息文本，补上请求信息，避免用例记录为空的异常说明
+            self.emit(f"请求异常: {e!r}")
+            raise asyncio.TimeoutError(f"请求超时: {method} {url}") from e
     
-    def login(self, username: str = "admin", password: str = "admin123") -> bool:
+    @staticmethod
+    async def gather_requests(*requests) -> List[APIResponse]:
+        """
+        并发发送多个相互独立的请求
+        
+        Args:
+            requests: make_request协程
+            
+        Returns:
+            按传入顺序排列的响应列表
+        """
+        responses = await asyncio.gather(*requests, return_exceptions=True)
+        for response in responses:
+            if isinstance(response, BaseException):
+                raise response
+        return responses
+    
+    async def login(self, username: str = "admin", password: str = "admin123") -> bool:
         """
         用户登录获取访问令牌
         
@@ -108,15 +244,16 @@ class AnalyticsAPITester:
             是否登录成功
         """
         try:
-            response = self.make_request('POST', '/api/auth/login', {
+            response = await self.make_request('POST', '/api/auth/login', {
                 'username': username,
                 'password': password
             })
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 200:
+                data = response.payload
                 if data.get('success') and 'access_token' in data.get('data', {}):
                     self.access_token = data['data']['access_token']
+                    self.session.headers['Authorization'] = f'Bearer {self.access_token}'
                     self.test_user_id = data['data'].get('id')
                     self.log_test("用户登录", True, f"登录成功，用户ID: {self.test_user_id}")
                     return True
@@ -124,14 +261,14 @@ class AnalyticsAPITester:
                     self.log_test("用户登录", False, "登录响应格式错误", data)
                     return False
             else:
-                self.log_test("用户登录", False, f"登录失败，状态码: {response.status_code}", 
-                            response.json() if response.content else response.text)
+                self.log_test("用户登录", False, f"登录失败，状态码: {response.status}", 
+                            response.payload)
                 return False
         except Exception as e:
             self.log_test("用户登录", False, f"登录异常: {str(e)}")
             return False
     
-    def get_test_repositories(self) -> List[int]:
+    async def get_test_repositories(self) -> List[int]:
         """
         获取测试用的仓库ID列表
         
@@ -139,28 +276,30 @@ class AnalyticsAPITester:
             仓库ID列表
         """
         try:
-            response = self.make_request('GET', '/api/repositories/')
-            if response.status_code == 200:
-                data = response.json()
+            response = await self.make_request('GET', '/api/repositories/')
+            if response.status == 200:
+                data = response.payload
                 repositories = data.get('data', [])
-                repo_ids = [repo['id'] for repo in repositories if repo.get('is_tracked', False)]
-                self.test_repo_ids = repo_ids[:3]  # 取前3个用于测试
+                # 取前3个已跟踪仓库用于测试，找够即停止遍历
+                tracked_ids = (repo['id'] for repo in repositories if repo.get('is_tracked', False))
+                self.test_repo_ids = list(itertools.islice(tracked_ids, 3))
+                self.test_repo_ids_param = ','.join(map(str, self.test_repo_ids))
                 return self.test_repo_ids
             else:
                 return []
         except Exception:
             return []
     
-    def test_analytics_overview(self):
+    async def test_analytics_overview(self):
         """
         测试分析概览接口
         """
         try:
             # 获取默认概览
-            response = self.make_request('GET', '/api/analytics/overview')
+            response = await self.make_request('GET', '/api/analytics/overview')
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 200:
+                data = response.payload
                 overview_data = data.get('data', {})
                 self.log_test(
                     "分析概览 - 默认查询", 
@@ -172,8 +311,8 @@ class AnalyticsAPITester:
                 self.log_test(
                     "分析概览 - 默认查询", 
                     False, 
-                    f"状态码: {response.status_code}",
-                    response.json() if response.content else response.text
+                    f"状态码: {response.status}",
+                    response.payload
                 )
             
             # 测试带参数的查询
@@ -185,12 +324,12 @@ class AnalyticsAPITester:
             }
             
             if self.test_repo_ids:
-                params['repository_ids'] = ','.join(map(str, self.test_repo_ids))
+                params['repository_ids'] = self.test_repo_ids_param
             
-            response = self.make_request('GET', '/api/analytics/overview', params=params)
+            response = await self.make_request('GET', '/api/analytics/overview', params=params)
             
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 200:
+                data = response.payload
                 self.log_test(
                     "分析概览 - 参数查询", 
                     True, 
@@ -201,23 +340,29 @@ class AnalyticsAPITester:
                 self.log_test(
                     "分析概览 - 参数查询", 
                     False, 
-                    f"状态码: {response.status_code}",
-                    response.json() if response.content else response.text
+                    f"状态码: {response.status}",
+                    response.payload
                 )
                 
         except Exception as e:
             self.log_test("分析概览测试", False, f"异常: {str(e)}")
     
-    def test_commits_analytics(self):
+    async def test_commits_analytics(self):
         """
         测试提交统计分析接口
         """
         try:
-            # 测试默认查询
-            response = self.make_request('GET', '/api/analytics/commits')
+            # 默认查询与各分组方式查询相互独立，并发发送
+            group_bys = ['day', 'week', 'month', 'author']
+            response, *group_responses = await self.gather_requests(
+                self.make_request('GET', '/api/analytics/commits'),
+                *(self.make_request('GET', '/api/analytics/commits', params={'group_by': group_by})
+                  for group_by in group_bys)
+            )
             
-            if response.status_code == 200:
-                data = response.json()
+            # 测试默认查询
+            if response.status == 200:
+                data = response.payload
                 commits_data = data.get('data', {})
                 self.log_test(
                     "提交统计 - 默认查询", 
@@ -229,17 +374,13 @@ class AnalyticsAPITester:
                 self.log_test(
                     "提交统计 - 默认查询", 
                     False, 
-                    f"状态码: {response.status_code}",
-                    response.json() if response.content else response.text
+                    f"状态码: {response.status}",
+                    response.payload
                 )
             
             # 测试不同分组方式
-            for group_by in ['day', 'week', 'month', 'author']:
-                params = {'group_by': group_by}
-                response = self.make_request('GET', '/api/analytics/commits', params=params)
-                
-                if response.status_code == 200:
-                    data = response.json()
+            for group_by, response in zip(group_bys, group_responses):
+                if response.status == 200:
                     self.log_test(
                         f"提交统计 - {group_by}分组", 
                         True, 
@@ -249,23 +390,29 @@ class AnalyticsAPITester:
                     self.log_test(
                         f"提交统计 - {group_by}分组", 
                         False, 
-                        f"状态码: {response.status_code}",
-                        response.json() if response.content else response.text
+                        f"状态码: {response.status}",
+                        response.payload
                     )
                     
         except Exception as e:
             self.log_test("提交统计测试", False, f"异常: {str(e)}")
     
-    def test_merge_requests_analytics(self):
+    async def test_merge_requests_analytics(self):
         """
         测试合并请求统计分析接口
         """
         try:
-            # 测试默认查询
-            response = self.make_request('GET', '/api/analytics/merge-requests')
+            # 默认查询与各状态筛选查询相互独立，并发发送
+            states = ['opened', 'merged', 'closed']
+            response, *state_responses = await self.gather_requests(
+                self.make_request('GET', '/api/analytics/merge-requests'),
+                *(self.make_request('GET', '/api/analytics/merge-requests', params={'state': state})
+                  for state in states)
+            )
             
-            if response.status_code == 200:
-                data = response.json()
+            # 测试默认查询
+            if response.status == 200:
+                data = response.payload
                 mrs_data = data.get('data', {})
                 self.log_test(
                     "合并请求统计 - 默认查询", 
@@ -277,17 +424,13 @@ class AnalyticsAPITester:
                 self.log_test(
                     "合并请求统计 - 默认查询", 
                     False, 
-                    f"状态码: {response.status_code}",
-                    response.json() if response.content else response.text
+                    f"状态码: {response.status}",
+                    response.payload
                 )
             
             # 测试状态筛选
-            for state in ['opened', 'merged', 'closed']:
-                params = {'state': state}
-                response = self.make_request('GET', '/api/analytics/merge-requests', params=params)
-                
-                if response.status_code == 200:
-                    data = response.json()
+            for state, response in zip(states, state_responses):
+                if response.status == 200:
                     self.log_test(
                         f"合并请求统计 - {state}状态", 
                         True, 
@@ -297,14 +440,14 @@ class AnalyticsAPITester:
                     self.log_test(
                         f"合并请求统计 - {state}状态", 
                         False, 
-                        f"状态码: {response.status_code}",
-                        response.json() if response.content else response.text
+                        f"状态码: {response.status}",
+                        response.payload
                     )
                     
         except Exception as e:
             self.log_test("合并请求统计测试", False, f"异常: {str(e)}")
     
-    def test_time_distribution(self):
+    async def test_time_distribution(self):
         """
         测试时间分布分析接口
         """
@@ -318,11 +461,14 @@ class AnalyticsAPITester:
                 {'type': 'merge_requests', 'dimension': 'weekday'}
             ]
             
-            for case in test_cases:
-                response = self.make_request('GET', '/api/analytics/time-distribution', params=case)
-                
-                if response.status_code == 200:
-                    data = response.json()
+            responses = await self.gather_requests(
+                *(self.make_request('GET', '/api/analytics/time-distribution', params=case)
+                  for case in test_cases)
+            )
+            
+            for case, response in zip(test_cases, responses):
+                if response.status == 200:
+                    data = response.payload
                     distribution_data = data.get('data', {})
                     self.log_test(
                         f"时间分布 - {case['type']}按{case['dimension']}", 
@@ -333,14 +479,14 @@ class AnalyticsAPITester:
                     self.log_test(
                         f"时间分布 - {case['type']}按{case['dimension']}", 
                         False, 
-                        f"状态码: {response.status_code}",
-                        response.json() if response.content else response.text
+                        f"状态码: {response.status}",
+                        response.payload
                     )
                     
         except Exception as e:
             self.log_test("时间分布测试", False, f"异常: {str(e)}")
     
-    def test_user_analytics(self):
+    async def test_user_analytics(self):
         """
         测试用户分析接口
         """
@@ -349,11 +495,17 @@ class AnalyticsAPITester:
             return
             
         try:
-            # 测试获取用户分析数据
-            response = self.make_request('GET', f'/api/analytics/user/{self.test_user_id}')
+            # 默认查询与各天数查询相互独立，并发发送
+            endpoint = f'/api/analytics/user/{self.test_user_id}'
+            days_options = [7, 30, 90]
+            response, *days_responses = await self.gather_requests(
+                self.make_request('GET', endpoint),
+                *(self.make_request('GET', endpoint, params={'days': days}) for days in days_options)
+            )
             
-            if response.status_code == 200:
-                data = response.json()
+            # 测试获取用户分析数据
+            if response.status == 200:
+                data = response.payload
                 user_data = data.get('user', {})
                 stats_data = data.get('statistics', {})
                 self.log_test(
@@ -366,16 +518,13 @@ class AnalyticsAPITester:
                 self.log_test(
                     "用户分析 - 默认查询", 
                     False, 
-                    f"状态码: {response.status_code}",
-                    response.json() if response.content else response.text
+                    f"状态码: {response.status}",
+                    response.payload
                 )
             
             # 测试不同天数参数
-            for days in [7, 30, 90]:
-                params = {'days': days}
-                response = self.make_request('GET', f'/api/analytics/user/{self.test_user_id}', params=params)
-                
-                if response.status_code == 200:
+            for days, response in zip(days_options, days_responses):
+                if response.status == 200:
                     self.log_test(
                         f"用户分析 - {days}天", 
                         True, 
@@ -385,61 +534,63 @@ class AnalyticsAPITester:
                     self.log_test(
                         f"用户分析 - {days}天", 
                         False, 
-                        f"状态码: {response.status_code}",
-                        response.json() if response.content else response.text
+                        f"状态码: {response.status}",
+                        response.payload
                     )
                     
         except Exception as e:
             self.log_test("用户分析测试", False, f"异常: {str(e)}")
     
-    def test_error_handling(self):
+    async def test_error_handling(self):
         """
         测试错误处理
         """
         try:
-            # 测试无效的日期格式
-            params = {
-                'start_date': 'invalid-date',
-                'end_date': '2024-12-31'
-            }
-            response = self.make_request('GET', '/api/analytics/overview', params=params)
+            # 三个错误探测请求相互独立，并发发送
+            date_response, repo_response, user_response = await self.gather_requests(
+                self.make_request('GET', '/api/analytics/overview', params={
+                    'start_date': 'invalid-date',
+                    'end_date': '2024-12-31'
+                }),
+                self.make_request('GET', '/api/analytics/commits', params={'repository_ids': 'invalid,ids'}),
+                self.make_request('GET', '/api/analytics/user/99999')
+            )
             
-            if response.status_code in [400, 422]:
+            # 测试无效的日期格式
+            response = date_response
+            if response.status in [400, 422]:
                 self.log_test(
                     "错误处理 - 无效日期", 
                     True, 
-                    f"正确返回错误状态码: {response.status_code}"
+                    f"正确返回错误状态码: {response.status}"
                 )
             else:
                 self.log_test(
                     "错误处理 - 无效日期", 
                     False, 
-                    f"期望400/422错误，实际状态码: {response.status_code}",
-                    response.json() if response.content else response.text
+                    f"期望400/422错误，实际状态码: {response.status}",
+                    response.payload
                 )
             
             # 测试无效的仓库ID
-            params = {'repository_ids': 'invalid,ids'}
-            response = self.make_request('GET', '/api/analytics/commits', params=params)
-            
-            if response.status_code in [400, 422]:
+            response = repo_response
+            if response.status in [400, 422]:
                 self.log_test(
                     "错误处理 - 无效仓库ID", 
                     True, 
-                    f"正确返回错误状态码: {response.status_code}"
+                    f"正确返回错误状态码: {response.status}"
                 )
             else:
                 self.log_test(
                     "错误处理 - 无效仓库ID", 
                     False, 
-                    f"期望400/422错误，实际状态码: {response.status_code}",
-                    response.json() if response.content else response.text
+                    f"期望400/422错误，实际状态码: {response.status}",
+                    response.payload
                 )
             
             # 测试不存在的用户
-            response = self.make_request('GET', '/api/analytics/user/99999')
-            
-            if response.status_code == 404:
+            response = user_response
+            if response.status == 404:
                 self.log_test(
                     "错误处理 - 不存在用户", 
                     True, 
@@ -449,65 +600,84 @@ class AnalyticsAPITester:
                 self.log_test(
                     "错误处理 - 不存在用户", 
                     False, 
-                    f"期望404错误，实际状态码: {response.status_code}",
-                    response.json() if response.content else response.text
+                    f"期望404错误，实际状态码: {response.status}",
+                    response.payload
                 )
                 
         except Exception as e:
             self.log_test("错误处理测试", False, f"异常: {str(e)}")
     
-    def save_test_results(self):
+    def save_test_results(self, pretty: bool = False):
         """
         保存测试结果到文件
+        
+        Args:
+            pretty: 是否额外保存一份带缩进的结果文件，便于排查失败用例
         """
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f'analytics_test_results_{timestamp}.json'
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.test_results, f, ensure_ascii=False, indent=2)
-        
+        results = [
+            {**result, 'timestamp': self._t0_wall + timedelta(microseconds=result['ts_ns'] // 1000)}
+            for result in self.test_results
+        ]
+        Path(filename).write_bytes(orjson.dumps(results, option=_JSON_DUMP_OPTIONS))
         print(f"\n详细测试结果已保存到: {filename}")
+        
+        if pretty:
+            pretty_filename = f'analytics_test_results_{timestamp}.pretty.json'
+            Path(pretty_filename).write_bytes(orjson.dumps(results, option=_JSON_PRETTY_OPTIONS))
+            print(f"带缩进的测试结果已保存到: {pretty_filename}")
     
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """
         运行所有分析统计接口测试
         """
-        print("=" * 50)
-        print("分析统计API接口测试")
-        print("=" * 50)
+        self.emit("=" * 50)
+        self.emit("分析统计API接口测试")
+        self.emit("=" * 50)
         
         # 登录获取访问令牌
-        if not self.login():
-            print("❌ 登录失败，跳过所有测试")
+        if not await self.login():
+            self.emit("❌ 登录失败，跳过所有测试")
+            self.flush_output()
             return
         
-        # 获取测试用的仓库
-        self.get_test_repositories()
-        print(f"\n📊 找到 {len(self.test_repo_ids)} 个测试仓库")
-        
-        # 运行各项测试
-        print("\n=== 分析概览测试 ===")
-        self.test_analytics_overview()
-        
-        print("\n=== 提交统计测试 ===")
-        self.test_commits_analytics()
-        
-        print("\n=== 合并请求统计测试 ===")
-        self.test_merge_requests_analytics()
-        
-        print("\n=== 时间分布测试 ===")
-        self.test_time_distribution()
+        # 获取测试用的仓库，同时预取默认概览写入响应缓存供概览测试复用；
+        # 预取失败不影响后续测试，概览测试会重新请求并记录结果
+        if self.cache_enabled:
+            await asyncio.gather(
+                self.get_test_repositories(),
+                self.make_request('GET', '/api/analytics/overview'),
+                return_exceptions=True
+            )
+        else:
+            await self.get_test_repositories()
+        self.emit(f"\n📊 找到 {len(self.test_repo_ids)} 个测试仓库")
         
-        print("\n=== 用户分析测试 ===")
-        self.test_user_analytics()
+        # 各测试组之间没有依赖，并发运行后按固定顺序输出和汇总结果
+        phase_outputs = await asyncio.gather(
+            self.run_phase("分析概览测试", self.test_analytics_overview),
+            self.run_phase("提交统计测试", self.test_commits_analytics),
+            self.run_phase("合并请求统计测试", self.test_merge_requests_analytics),
+            self.run_phase("时间分布测试", self.test_time_distribution),
+            self.run_phase("用户分析测试", self.test_user_analytics),
+            self.run_phase("错误处理测试", self.test_error_handling)
+        )
+        for lines, results in phase_outputs:
+            self._pending_lines.extend(lines)
+            self.test_results.extend(results)
         
-        print("\n=== 错误处理测试 ===")
-        self.test_error_handling()
+        self.flush_output()
         
-        # 统计测试结果
+        # 统计测试结果，一次遍历同时收集失败用例
+        failed_lines = [
+            f"  ❌ {result['test_name']}: {result['message']}"
+            for result in self.test_results if not result['success']
+        ]
         total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result['success'])
-        failed_tests = total_tests - passed_tests
+        failed_tests = len(failed_lines)
+        passed_tests = total_tests - failed_tests
         success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
         
         print("\n" + "=" * 50)
@@ -520,19 +690,17 @@ class AnalyticsAPITester:
         
         if failed_tests > 0:
             print("\n失败的测试:")
-            for result in self.test_results:
-                if not result['success']:
-                    print(f"  ❌ {result['test_name']}: {result['message']}")
+            print('\n'.join(failed_lines))
         
         # 保存测试结果
-        self.save_test_results()
+        self.save_test_results(pretty=failed_tests > 0)
 
-def main():
+async def main():
     """
     主函数
     """
-    tester = AnalyticsAPITester()
-    tester.run_all_tests()
+    async with AnalyticsAPITester() as tester:
+        await tester.run_all_tests()
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
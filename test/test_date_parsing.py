@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 
+import re
 import sys
+import time
 sys.path.append('backend')
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 try:
@@ -11,10 +14,62 @@ try:
 except ImportError:
     date_parser = None
 
+# 备用解析格式（未安装dateutil时使用）
+_FALLBACK_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%SZ',
+    '%Y-%m-%dT%H:%M:%S.%f',
+    '%Y-%m-%dT%H:%M:%S.%fZ'
+)
+
+# 常见ISO日期/时间格式，匹配后直接按分组构造datetime
+_ISO_RE = re.compile(
+    r'(\d{4})-(\d\d?)-(\d\d?)'
+    r'(?:([ T])(\d\d?):(\d\d?):(\d\d?)(?:\.(\d{1,6}))?(Z)?)?\Z'
+)
+
+def _parse_iso(date_string: str) -> Optional[datetime]:
+    """
+    快速解析常见ISO格式，无法确定与原解析方式结果一致时返回None交由后续逻辑处理
+    """
+    match = _ISO_RE.match(date_string)
+    if not match:
+        return None
+    year, month, day, sep, hour, minute, second, fraction, zulu = match.groups()
+    # 空格分隔的格式不带小数秒和Z；带Z时dateutil返回带时区的结果，仍交给dateutil
+    if sep == ' ' and (fraction or zulu):
+        return None
+    if zulu and date_parser:
+        return None
+    try:
+        return datetime(
+            int(year), int(month), int(day),
+            int(hour or 0), int(minute or 0), int(second or 0),
+            int(fraction.ljust(6, '0')) if fraction else 0
+        )
+    except ValueError:
+        return None
+
+def _guess_format(date_string: str) -> str:
+    """
+    根据分隔符直接选出最可能匹配的备用格式，避免逐个试错
+    """
+    if 'T' not in date_string:
+        return '%Y-%m-%d %H:%M:%S' if len(date_string) > 10 else '%Y-%m-%d'
+    if '.' in date_string:
+        return '%Y-%m-%dT%H:%M:%S.%fZ' if date_string.endswith('Z') else '%Y-%m-%dT%H:%M:%S.%f'
+    return '%Y-%m-%dT%H:%M:%SZ' if date_string.endswith('Z') else '%Y-%m-%dT%H:%M:%S'
+
+@lru_cache(maxsize=1024)
 def parse_datetime_string(date_string: str) -> Optional[datetime]:
     """
     解析日期时间字符串
     
+    结果按输入字符串缓存（datetime不可变，可安全共享），
+    需要重置时调用 parse_datetime_string.cache_clear()
+    
     Args:
         date_string (str): 日期时间字符串
     
@@ -24,24 +79,29 @@ def parse_datetime_string(date_string: str) -> Optional[datetime]:
     if not date_string:
         return None
     
+    # 常见格式直接构造，跳过dateutil和strptime
+    parsed = _parse_iso(date_string)
+    if parsed is not None:
+        return parsed
+    
     try:
         # 尝试使用dateutil解析
         if date_parser:
             return date_parser.parse(date_string)
         
-        # 备用解析方法
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%dT%H:%M:%S.%f',
-            '%Y-%m-%dT%H:%M:%S.%fZ'
-        ]
+        # 备用解析方法：先尝试按分隔符选出的格式，失败再依次尝试其余格式
+        strptime = datetime.strptime
+        guessed = _guess_format(date_string)
+        try:
+            return strptime(date_string, guessed)
+        except ValueError:
+            pass
         
-        for fmt in formats:
+        for fmt in _FALLBACK_FORMATS:
+            if fmt == guessed:
+                continue
             try:
-                return datetime.strptime(date_string, fmt)
+                return strptime(date_string, fmt)
             except ValueError:
                 continue
         
@@ -49,12 +109,26 @@ def parse_datetime_string(date_string: str) -> Optional[datetime]:
     except Exception:
         return None
 
+# 当前UTC时间的缓存：[单调时钟读数, 对应的utcnow]，最多滞后1秒
+_NOW_TTL_SECONDS = 1.0
+_last_now = [float('-inf'), None]
+
+def _now_cached() -> datetime:
+    """
+    获取当前UTC时间，1秒内的重复调用复用同一个值
+    仅用于计算默认日期范围（如30天前），1秒的误差可以忽略
+    """
+    t = time.monotonic()
+    if t - _last_now[0] > _NOW_TTL_SECONDS:
+        _last_now[:] = [t, datetime.utcnow()]
+    return _last_now[1]
+
 def get_date_range_by_params(start_date: Optional[str] = None, end_date: Optional[str] = None, 
                   days: Optional[int] = None, strict: bool = False):
     """
     获取日期范围
     """
-    now = datetime.utcnow()
+    now = _now_cached()
     
     # 如果指定了天数，从今天往前推
     if days:
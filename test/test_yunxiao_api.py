@@ -10,9 +10,30 @@
 """
 
 import requests
-import json
+import orjson
 import os
-from typing import Dict, List, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# 设置 YUNXIAO_CACHE=1 时将GET响应缓存到本地，重复运行无需再请求云效
+_CACHE_ENABLED = os.environ.get('YUNXIAO_CACHE') == '1'
+# 接口返回结构变化时递增版本号，旧缓存随之失效
+_CACHE_VERSION = 1
+_CACHE_EXPIRE_SECONDS = 3600
+
+# .env中的 KEY=VALUE 行，键和值两侧空白不计入，#开头的注释行不匹配
+_ENV_LINE_RE = re.compile(r'^[^\S\n]*([^#=\s][^=\n]*?)?[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$', re.M)
 
 class YunxiaoAPITester:
     """云效API测试类"""
@@ -34,10 +55,46 @@ class YunxiaoAPITester:
             self.base_url = domain
         else:
             self.base_url = f"https://{domain}"
+        # 仓库相关接口的URL前缀在实例生命周期内不变，只拼接一次
+        self.repositories_url = f"{self.base_url}/oapi/v1/codeup/organizations/{organization_id}/repositories"
         self.headers = {
             'Content-Type': 'application/json',
             'x-yunxiao-token': access_token
         }
+        # 所有请求都发往同一个云效域名，复用会话以保持长连接，省去重复的TCP/TLS握手
+        self.session = self._create_session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        ))
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        创建HTTP会话，启用缓存时返回基于sqlite的缓存会话
+        
+        Returns:
+            requests.Session: HTTP会话
+        """
+        if _CACHE_ENABLED:
+            if requests_cache is not None:
+                return requests_cache.CachedSession(
+                    f'.yunxiao_cache_v{_CACHE_VERSION}',
+                    backend='sqlite',
+                    expire_after=_CACHE_EXPIRE_SECONDS,
+                    allowable_methods=('GET',),
+                    cache_control=True
+                )
+            print("⚠️ 未安装 requests-cache，已忽略 YUNXIAO_CACHE 设置")
+        return requests.Session()
+    
+    def close(self):
+        """
+        关闭HTTP会话
+        """
+        self.session.close()
     
     def test_connection(self) -> bool:
         """
@@ -48,14 +105,14 @@ class YunxiaoAPITester:
         """
         try:
             # 使用获取仓库列表API测试连接
-            url = f"{self.base_url}/oapi/v1/codeup/organizations/{self.organization_id}/repositories"
+            url = self.repositories_url
             params = {
                 'page': 1,
                 'perPage': 1  # 只获取1个仓库用于测试连接
             }
             
             print(f"测试连接到: {url}")
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             
             print(f"响应状态码: {response.status_code}")
             print(f"响应头: {dict(response.headers)}")
@@ -74,7 +131,8 @@ class YunxiaoAPITester:
     
     def list_repositories(self, page: int = 1, per_page: int = 20, 
                          search: Optional[str] = None, 
-                         archived: bool = False) -> Optional[List[Dict]]:
+                         archived: bool = False,
+                         verbose: bool = True) -> Optional[List[Dict]]:
         """
         获取仓库列表
         
@@ -83,12 +141,13 @@ class YunxiaoAPITester:
             per_page: 每页大小，默认20，取值范围[1,100]
             search: 搜索关键字，用于模糊匹配代码库路径
             archived: 是否归档
+            verbose: 是否打印请求过程信息（错误信息始终打印）
             
         Returns:
             Optional[List[Dict]]: 仓库列表，失败时返回None
         """
         try:
-            url = f"{self.base_url}/oapi/v1/codeup/organizations/{self.organization_id}/repositories"
+            url = self.repositories_url
             params = {
                 'page': page,
                 'perPage': per_page,
@@ -100,20 +159,26 @@ class YunxiaoAPITester:
             if search:
                 params['search'] = search
             
-            print(f"\n获取仓库列表: {url}")
-            print(f"请求参数: {params}")
+            if verbose:
+                print(f"\n获取仓库列表: {url}")
+                print(f"请求参数: {params}")
             
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self.session.get(url, params=params, timeout=30)
             
-            print(f"响应状态码: {response.status_code}")
+            if verbose:
+                print(f"响应状态码: {response.status_code}")
             
             if response.status_code == 200:
-                print(f"响应内容: {response.text[:500]}...")  # 打印前500个字符
+                # 直接解析原始字节，预览只解码前500字节，避免整个响应体被解码两次
+                body = response.content
+                if verbose:
+                    print(f"响应内容: {body[:500].decode('utf-8', errors='replace')}...")  # 打印前500个字符
                 try:
-                    repositories = response.json()
-                    print(f"✅ 成功获取 {len(repositories)} 个仓库")
+                    repositories = orjson.loads(body)
+                    if verbose:
+                        print(f"✅ 成功获取 {len(repositories)} 个仓库")
                     return repositories
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     print(f"❌ JSON解析失败: {e}")
                     print(f"响应可能不是JSON格式，内容类型: {response.headers.get('Content-Type')}")
                     return None
@@ -125,36 +190,73 @@ class YunxiaoAPITester:
         except requests.exceptions.RequestException as e:
             print(f"❌ 请求异常: {e}")
             return None
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"❌ JSON解析异常: {e}")
             return None
     
-    def get_repository_details(self, repo_id: str) -> Optional[Dict]:
+    def iter_all_repositories(self, per_page: int = 100,
+                              search: Optional[str] = None,
+                              archived: bool = False) -> Iterator[Dict]:
+        """
+        逐页遍历全部仓库
+        
+        处理当前页的同时在后台预取下一页，返回条数不足一页时结束。
+        
+        Args:
+            per_page: 每页大小，默认100（接口上限），以减少请求次数
+            search: 搜索关键字，用于模糊匹配代码库路径
+            archived: 是否归档
+            
+        Yields:
+            Dict: 仓库信息；某页请求失败时提前结束
+        """
+        fetch = partial(self.list_repositories, per_page=per_page, search=search,
+                        archived=archived, verbose=False)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = 1
+            future = executor.submit(fetch, page)
+            while True:
+                repositories = future.result()
+                if not repositories:
+                    return
+                if len(repositories) < per_page:
+                    yield from repositories
+                    return
+                page += 1
+                # 先提交下一页请求，再产出当前页
+                future = executor.submit(fetch, page)
+                yield from repositories
+    
+    def get_repository_details(self, repo_id: str, verbose: bool = True) -> Optional[Dict]:
         """
         获取单个仓库详情（使用云效Codeup API）
         
         Args:
             repo_id: 仓库ID
+            verbose: 是否打印请求过程信息（错误信息始终打印）
             
         Returns:
             Optional[Dict]: 仓库详情，失败时返回None
         """
         try:
             # 使用云效Codeup API获取仓库详情
-            url = f"{self.base_url}/oapi/v1/codeup/organizations/{self.organization_id}/repositories/{repo_id}"
+            url = f"{self.repositories_url}/{repo_id}"
             
-            print(f"\n获取仓库详情: {url}")
+            if verbose:
+                print(f"\n获取仓库详情: {url}")
             
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self.session.get(url, timeout=30)
             
-            print(f"响应状态码: {response.status_code}")
+            if verbose:
+                print(f"响应状态码: {response.status_code}")
             
             if response.status_code == 200:
                 try:
-                    result = response.json()
-                    print("✅ 成功获取仓库详情")
+                    result = orjson.loads(response.content)
+                    if verbose:
+                        print("✅ 成功获取仓库详情")
                     return result
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     print(f"❌ JSON解析失败: {e}")
                     print(f"响应内容: {response.text[:500]}...")
                     return None
@@ -167,6 +269,24 @@ class YunxiaoAPITester:
             print(f"❌ 请求异常: {e}")
             return None
     
+    def get_repositories_details(self, repo_ids: List[str], max_workers: int = 10) -> List[Optional[Dict]]:
+        """
+        并发获取多个仓库详情
+        
+        Args:
+            repo_ids: 仓库ID列表
+            max_workers: 最大并发数，不超过会话连接池大小
+            
+        Returns:
+            List[Optional[Dict]]: 与repo_ids一一对应的仓库详情，失败项为None
+        """
+        if not repo_ids:
+            return []
+        # 各线程的过程输出会相互穿插，这里关闭过程打印
+        fetch = partial(self.get_repository_details, verbose=False)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(repo_ids))) as executor:
+            return list(executor.map(fetch, repo_ids))
+    
     def print_repository_info(self, repositories: List[Dict]):
         """
         打印仓库信息
@@ -174,17 +294,21 @@ class YunxiaoAPITester:
         Args:
             repositories: 仓库列表
         """
-        print("\n=== 仓库列表 ===")
+        # 拼好整段文本后一次输出
+        lines = ["\n=== 仓库列表 ==="]
         for i, repo in enumerate(repositories, 1):
-            print(f"{i}. {repo.get('name', 'N/A')}")
-            print(f"   ID: {repo.get('id', 'N/A')}")
-            print(f"   路径: {repo.get('pathWithNamespace', 'N/A')}")
-            print(f"   描述: {repo.get('description', 'N/A')}")
-            print(f"   可见性: {repo.get('visibility', 'N/A')}")
-            print(f"   创建时间: {repo.get('createdAt', 'N/A')}")
-            print(f"   最后活跃: {repo.get('lastActivityAt', 'N/A')}")
-            print(f"   Web URL: {repo.get('webUrl', 'N/A')}")
-            print()
+            lines += (
+                f"{i}. {repo.get('name', 'N/A')}",
+                f"   ID: {repo.get('id', 'N/A')}",
+                f"   路径: {repo.get('pathWithNamespace', 'N/A')}",
+                f"   描述: {repo.get('description', 'N/A')}",
+                f"   可见性: {repo.get('visibility', 'N/A')}",
+                f"   创建时间: {repo.get('createdAt', 'N/A')}",
+                f"   最后活跃: {repo.get('lastActivityAt', 'N/A')}",
+                f"   Web URL: {repo.get('webUrl', 'N/A')}",
+                ""
+            )
+        print('\n'.join(lines))
 
 def load_env_config():
     """
@@ -193,23 +317,14 @@ def load_env_config():
     Returns:
         tuple: (domain, organization_id, access_token)
     """
-    import os
-    from pathlib import Path
-    
     # 查找.env文件
     env_file = Path(__file__).parent / "backend" / ".env"
     if not env_file.exists():
         print(f"❌ 找不到.env文件: {env_file}")
         return None, None, None
     
-    # 读取.env文件
-    config = {}
-    with open(env_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                config[key.strip()] = value.strip()
+    # 读取.env文件，一次正则扫描取出全部 KEY=VALUE
+    config = dict(_ENV_LINE_RE.findall(env_file.read_text(encoding='utf-8')))
     
     # 提取云效配置
     api_base_url = config.get('ALIYUNXIAO_API_BASE_URL', '')
@@ -254,33 +369,33 @@ def main():
     print(f"   访问令牌: {access_token[:20]}...")
     
     # 创建测试器
-    tester = YunxiaoAPITester(domain, organization_id, access_token)
-    
-    # 测试连接
-    print("\n1. 测试API连接...")
-    if not tester.test_connection():
-        print("❌ API连接失败，请检查配置")
-        return
-    
-    # 获取仓库列表
-    print("\n2. 获取仓库列表...")
-    repositories = tester.list_repositories(page=1, per_page=10)
-    
-    if repositories:
-        tester.print_repository_info(repositories)
+    with closing(YunxiaoAPITester(domain, organization_id, access_token)) as tester:
+        # 测试连接
+        print("\n1. 测试API连接...")
+        if not tester.test_connection():
+            print("❌ API连接失败，请检查配置")
+            return
+        
+        # 逐页获取全部仓库列表
+        print("\n2. 获取仓库列表...")
+        repositories = list(tester.iter_all_repositories())
         
-        # 如果有仓库，测试获取单个仓库详情
         if repositories:
-            print("\n3. 测试获取单个仓库详情...")
-            first_repo = repositories[0]
-            repo_id = first_repo.get('id')
-            if repo_id:
-                details = tester.get_repository_details(str(repo_id))
-                if details:
-                    print(f"仓库详情获取成功: {details.get('name')}")
-    else:
-        print("❌ 无法获取仓库列表")
-    
+            print(f"✅ 共获取 {len(repositories)} 个仓库")
+            tester.print_repository_info(repositories)
+        
+            # 如果有仓库，测试获取单个仓库详情
+            if repositories:
+                print("\n3. 测试获取单个仓库详情...")
+                first_repo = repositories[0]
+                repo_id = first_repo.get('id')
+                if repo_id:
+                    details = tester.get_repository_details(str(repo_id))
+                    if details:
+                        print(f"仓库详情获取成功: {details.get('name')}")
+        else:
+            print("❌ 无法获取仓库列表")
+        
     print("\n=== 测试完成 ===")
 
 if __name__ == "__main__":
@@ -8,32 +8,119 @@
 2. 添加云效仓库接口
 3. 仓库加入/移出统计接口
 4. 冲突处理测试
+5. 批量添加仓库接口
+6. 提交记录游标分页
 
 作者: AI Assistant
 创建时间: 2025-01-23
 """
 
-import requests
-import json
+import asyncio
+import httpx
+import orjson
 import time
-from datetime import datetime
-from typing import Dict, List, Optional
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+# 控制台输出的详细信息最多保留的字节数
+_DETAILS_PREVIEW_BYTES = 2048
+# 非JSON错误响应最多记录的字符数
+_ERROR_TEXT_LIMIT = 2000
+# 只校验状态码时，不超过该长度的响应体仍会读完，使连接可以放回连接池复用
+_STATUS_ONLY_DRAIN_BYTES = 16 * 1024
+# 健康检查的超时时间（秒），后端不可达时尽快结束测试
+_HEALTH_CHECK_TIMEOUT = 1.0
+_HTTP_METHODS = frozenset({'GET', 'POST', 'PUT', 'DELETE'})
+# 游标分页的响应头，与后端 app/api/v1/repositories.py 保持一致
+_HAS_NEXT_HEADER = 'X-Has-Next'
+_NEXT_BEFORE_DATE_HEADER = 'X-Next-Before-Date'
+_NEXT_BEFORE_ID_HEADER = 'X-Next-Before-Id'
+# 当前测试组的输出缓冲，并发运行的测试组各自缓冲，避免输出相互穿插
+_group_lines: ContextVar[Optional[List[str]]] = ContextVar('_group_lines', default=None)
+# 结果序列化选项：缩进输出，允许非字符串键
+_JSON_PRETTY_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+class CaseResult(NamedTuple):
+    """
+    单条测试结果
+    """
+    test_name: str
+    success: bool
+    message: str
+    details: Any
+    ts_ns: int  # 相对测试器创建时刻的单调时钟纳秒数
+
+
+def _json(response: httpx.Response):
+    """
+    解析JSON响应体
+    
+    Args:
+        response: 响应对象
+        
+    Returns:
+        解析后的JSON对象
+    """
+    return orjson.loads(response.content)
+
+
+def _safe_json(response: httpx.Response):
+    """
+    解析响应体用于记录失败详情，非JSON响应（含空响应）返回截断后的原始文本
+    
+    Args:
+        response: 响应对象
+        
+    Returns:
+        解析后的JSON对象或原始文本
+    """
+    try:
+        return _json(response)
+    except ValueError:
+        return response.text[:_ERROR_TEXT_LIMIT]
 
 
 class YunxiaoRepositoryTester:
     """云效仓库接口测试类"""
     
-    def __init__(self, base_url: str = "http://127.0.0.1:5000"):
+    def __init__(self, base_url: str = "http://127.0.0.1:5000", verbose: bool = False):
         """
         初始化测试器
         
         Args:
             base_url: 后端API基础URL
+            verbose: 是否在控制台输出每条测试的详细信息
         """
         self.base_url = base_url
+        self.verbose = verbose
         self.access_token = None
-        self.test_results = []
+        self.test_results: List[CaseResult] = []
+        # 记录结果时只取单调时钟，写文件时再统一换算为时间戳
+        self._t0_ns = time.monotonic_ns()
+        self._t0_wall = datetime.now()
         self.test_repo_id = None
+        # 所有用例共用一个客户端，并发的用例共享连接池并复用到后端的长连接
+        self.client = httpx.AsyncClient(
+            headers={'Content-Type': 'application/json'},
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(30.0, connect=3.05),
+            follow_redirects=True
+        )
+    
+    async def __aenter__(self):
+        """
+        进入上下文，返回测试器本身
+        """
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """
+        退出上下文时关闭HTTP客户端
+        """
+        await self.client.aclose()
         
     def log_test(self, test_name: str, success: bool, message: str, details: Optional[Dict] = None):
         """
@@ -45,22 +132,47 @@ class YunxiaoRepositoryTester:
             message: 测试消息
             details: 详细信息
         """
-        result = {
-            'test_name': test_name,
-            'success': success,
-            'message': message,
-            'details': details,
-            'timestamp': datetime.now().isoformat()
-        }
-        self.test_results.append(result)
+        self.test_results.append(CaseResult(
+            test_name, success, message, details, time.monotonic_ns() - self._t0_ns
+        ))
         
         status = "✅ 成功" if success else "❌ 失败"
-        print(f"{status} - {test_name}: {message}")
-        if details:
-            print(f"   详细信息: {json.dumps(details, ensure_ascii=False, indent=2)}")
+        self.emit(f"{status} - {test_name}: {message}")
+        if details and self.verbose:
+            preview = orjson.dumps(details, option=_JSON_PRETTY_OPTIONS)
+            if len(preview) > _DETAILS_PREVIEW_BYTES:
+                preview = preview[:_DETAILS_PREVIEW_BYTES] + b'...'
+            self.emit(f"   详细信息: {preview.decode('utf-8', errors='ignore')}")
     
-    def make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
-                    params: Optional[Dict] = None) -> requests.Response:
+    def emit(self, line: str):
+        """
+        输出一行，处于测试组中时写入该组的缓冲
+        """
+        lines = _group_lines.get()
+        if lines is None:
+            print(line)
+        else:
+            lines.append(line)
+    
+    async def run_group(self, *tests) -> List[str]:
+        """
+        按顺序运行一组相互依赖的测试
+        
+        Args:
+            tests: 测试协程函数
+            
+        Returns:
+            List[str]: 该组的控制台输出
+        """
+        lines = []
+        _group_lines.set(lines)
+        for test in tests:
+            await test()
+        return lines
+    
+    async def make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
+                          params: Optional[Dict] = None,
+                          expect_status_only: bool = False) -> httpx.Response:
         """
         发送HTTP请求
         
@@ -69,30 +181,48 @@ class YunxiaoRepositoryTester:
             endpoint: API端点
             data: 请求数据
             params: 查询参数
+            expect_status_only: 调用方只校验状态码，不读取响应体
             
         Returns:
-            requests.Response: 响应对象
+            httpx.Response: 响应对象；expect_status_only时响应体可能未读取
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = {
-            'Content-Type': 'application/json'
-        }
+        method = method.upper()
+        if method not in _HTTP_METHODS:
+            raise ValueError(f"不支持的HTTP方法: {method}")
+        
+        # 请求头（含登录后的认证头）已设置在客户端上
+        request = self.client.build_request(method, f"{self.base_url}{endpoint}", json=data, params=params)
+        if not expect_status_only:
+            return await self.client.send(request)
         
-        if self.access_token:
-            headers['Authorization'] = f'Bearer {self.access_token}'
-        
-        if method.upper() == 'GET':
-            return requests.get(url, headers=headers, params=params)
-        elif method.upper() == 'POST':
-            return requests.post(url, headers=headers, json=data, params=params)
-        elif method.upper() == 'PUT':
-            return requests.put(url, headers=headers, json=data)
-        elif method.upper() == 'DELETE':
-            return requests.delete(url, headers=headers)
+        # 先只接收状态行和响应头；响应体较小时读完以复用连接，否则直接关闭连接不再下载
+        response = await self.client.send(request, stream=True)
+        content_length = response.headers.get('Content-Length')
+        if content_length is not None and int(content_length) <= _STATUS_ONLY_DRAIN_BYTES:
+            await response.aread()
         else:
-            raise ValueError(f"不支持的HTTP方法: {method}")
+            await response.aclose()
+        return response
     
-    def login(self, username: str = "admin", password: str = "admin123") -> bool:
+    async def check_health(self) -> bool:
+        """
+        探测后端健康检查接口
+        
+        Returns:
+            bool: 后端是否可用
+        """
+        try:
+            response = await self.client.get(f"{self.base_url}/health", timeout=_HEALTH_CHECK_TIMEOUT)
+        except httpx.HTTPError as e:
+            print(f"❌ 服务不可达: {e!r}")
+            return False
+        
+        if response.status_code != 200:
+            print(f"❌ 健康检查失败，状态码: {response.status_code}")
+            return False
+        return True
+    
+    async def login(self, username: str = "admin", password: str = "admin123") -> bool:
         """
         用户登录获取访问令牌
         
@@ -106,15 +236,16 @@ class YunxiaoRepositoryTester:
         print("\n=== 用户登录 ===")
         
         try:
-            response = self.make_request('POST', '/api/auth/login', {
+            response = await self.make_request('POST', '/api/auth/login', {
                 'username': username,
                 'password': password
             })
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 self.access_token = data.get('data', {}).get('access_token')
                 if self.access_token:
+                    self.client.headers['Authorization'] = f'Bearer {self.access_token}'
                     self.log_test("用户登录", True, f"登录成功，用户: {username}")
                     return True
                 else:
@@ -125,7 +256,7 @@ class YunxiaoRepositoryTester:
                     "用户登录", 
                     False, 
                     f"登录失败，状态码: {response.status_code}",
-                    response.json() if response.content else response.text
+                    _safe_json(response)
                 )
                 return False
                 
@@ -133,27 +264,36 @@ class YunxiaoRepositoryTester:
             self.log_test("用户登录", False, f"登录异常: {str(e)}")
             return False
     
-    def test_yunxiao_search(self):
+    async def test_yunxiao_search(self):
         """
         测试云效仓库搜索接口
         """
-        print("\n=== 云效仓库搜索测试 ===")
+        self.emit("\n=== 云效仓库搜索测试 ===")
         
         if not self.access_token:
             self.log_test("云效仓库搜索", False, "跳过测试 - 未登录")
             return
         
+        # 三个子用例相互独立，先并发发出请求，再按顺序校验结果
+        normal_search, paged_search = [
+            asyncio.create_task(self.make_request('GET', '/api/repositories/yunxiao/search', params=params))
+            for params in (
+                {'page': 1, 'per_page': 10, 'search': 'test'},
+                {'page': 2, 'per_page': 5, 'search': 'repo'}
+            )
+        ]
+        empty_search = asyncio.create_task(self.make_request(
+            'GET', '/api/repositories/yunxiao/search',
+            params={'page': 1, 'per_page': 10, 'search': ''},
+            expect_status_only=True
+        ))
+        
         # 测试用例1: 正常搜索
         try:
-            params = {
-                'page': 1,
-                'per_page': 10,
-                'search': 'test'
-            }
-            response = self.make_request('GET', '/api/repositories/yunxiao/search', params=params)
+            response = await normal_search
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 repositories = data.get('data', [])
                 self.log_test(
                     "云效仓库搜索 - 正常搜索", 
@@ -166,19 +306,14 @@ class YunxiaoRepositoryTester:
                     "云效仓库搜索 - 正常搜索", 
                     False, 
                     f"状态码: {response.status_code}",
-                    response.json() if response.content else response.text
+                    _safe_json(response)
                 )
         except Exception as e:
             self.log_test("云效仓库搜索 - 正常搜索", False, f"异常: {str(e)}")
         
         # 测试用例2: 空搜索关键词
         try:
-            params = {
-                'page': 1,
-                'per_page': 10,
-                'search': ''
-            }
-            response = self.make_request('GET', '/api/repositories/yunxiao/search', params=params)
+            response = await empty_search
             
             if response.status_code == 400:
                 self.log_test(
@@ -197,15 +332,10 @@ class YunxiaoRepositoryTester:
         
         # 测试用例3: 分页测试
         try:
-            params = {
-                'page': 2,
-                'per_page': 5,
-                'search': 'repo'
-            }
-            response = self.make_request('GET', '/api/repositories/yunxiao/search', params=params)
+            response = await paged_search
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 pagination = data.get('pagination', {})
                 self.log_test(
                     "云效仓库搜索 - 分页测试", 
@@ -222,31 +352,54 @@ class YunxiaoRepositoryTester:
         except Exception as e:
             self.log_test("云效仓库搜索 - 分页测试", False, f"异常: {str(e)}")
     
-    def test_yunxiao_add_repository(self):
+    async def add_repositories_bulk(self, repos: List[Dict]) -> httpx.Response:
+        """
+        一次请求批量添加多个仓库
+        
+        Args:
+            repos: 仓库数据列表
+            
+        Returns:
+            httpx.Response: 响应对象，items中逐项给出status、id、error
+        """
+        return await self.make_request('POST', '/api/repositories/batch', data={'repositories': repos})
+    
+    async def test_yunxiao_add_repository(self):
         """
         测试添加云效仓库接口
         """
-        print("\n=== 添加云效仓库测试 ===")
+        self.emit("\n=== 添加云效仓库测试 ===")
         
         if not self.access_token:
             self.log_test("添加云效仓库", False, "跳过测试 - 未登录")
             return
         
-        # 测试数据
+        # 测试数据，各字段使用同一时间戳，避免跨秒时名称与URL不一致
+        ts = int(time.time())
         test_repo_data = {
             'repository_id': 12345,
-            'name': 'test-repo-' + str(int(time.time())),
-            'clone_url': f'https://codeup.aliyun.com/test/test-repo-{int(time.time())}.git',
-            'web_url': f'https://codeup.aliyun.com/test/test-repo-{int(time.time())}',
+            'name': f'test-repo-{ts}',
+            'clone_url': f'https://codeup.aliyun.com/test/test-repo-{ts}.git',
+            'web_url': f'https://codeup.aliyun.com/test/test-repo-{ts}',
             'description': 'Test repository for API testing'
         }
+        invalid_data = {
+            'repository_id': 12346,
+            'name': 'invalid-repo'
+            # 缺少 clone_url
+        }
+        # 缺少字段的用例不依赖前两个用例，与其并发发送
+        invalid_add = asyncio.create_task(
+            self.make_request('POST', '/api/repositories/yunxiao/add', data=invalid_data,
+                              expect_status_only=True)
+        )
         
         # 测试用例1: 正常添加仓库
         try:
-            response = self.make_request('POST', '/api/repositories/yunxiao/add', data=test_repo_data)
+            response = await self.make_request('POST', '/api/repositories/yunxiao/add', data=test_repo_data)
             
             if response.status_code == 201:
-                data = response.json()
+                data = _json(response)
                 repo_data = data.get('data', {})
                 self.test_repo_id = repo_data.get('id')
                 self.log_test(
@@ -260,21 +413,21 @@ class YunxiaoRepositoryTester:
                     "添加云效仓库 - 正常添加", 
                     False, 
                     f"状态码: {response.status_code}",
-                    response.json() if response.content else response.text
+                    _safe_json(response)
                 )
         except Exception as e:
             self.log_test("添加云效仓库 - 正常添加", False, f"异常: {str(e)}")
         
         # 测试用例2: 重复添加（409冲突测试）
         try:
-            response = self.make_request('POST', '/api/repositories/yunxiao/add', data=test_repo_data)
+            response = await self.make_request('POST', '/api/repositories/yunxiao/add', data=test_repo_data)
             
             if response.status_code == 409:
                 self.log_test(
                     "添加云效仓库 - 重复添加", 
                     True, 
                     "正确返回409冲突错误",
-                    response.json() if response.content else None
+                    _safe_json(response)
                 )
             else:
                 self.log_test(
@@ -287,12 +440,7 @@ class YunxiaoRepositoryTester:
         
         # 测试用例3: 缺少必需字段
         try:
-            invalid_data = {
-                'repository_id': 12346,
-                'name': 'invalid-repo'
-                # 缺少 clone_url
-            }
-            response = self.make_request('POST', '/api/repositories/yunxiao/add', data=invalid_data)
+            response = await invalid_add
             
             if response.status_code == 400:
                 self.log_test(
@@ -309,11 +457,11 @@ class YunxiaoRepositoryTester:
         except Exception as e:
             self.log_test("添加云效仓库 - 缺少字段", False, f"异常: {str(e)}")
     
-    def test_repository_tracking(self):
+    async def test_repository_tracking(self):
         """
         测试仓库统计管理接口
         """
-        print("\n=== 仓库统计管理测试 ===")
+        self.emit("\n=== 仓库统计管理测试 ===")
         
         if not self.access_token:
             self.log_test("仓库统计管理", False, "跳过测试 - 未登录")
@@ -323,12 +471,18 @@ class YunxiaoRepositoryTester:
             self.log_test("仓库统计管理", False, "跳过测试 - 没有测试仓库ID")
             return
         
+        # 不存在仓库的用例不依赖前面的加入/移出操作，与其并发发送
+        fake_repo_id = 999999
+        missing_track = asyncio.create_task(
+            self.make_request('POST', f'/api/repositories/{fake_repo_id}/track', expect_status_only=True)
+        )
+        
         # 测试用例1: 加入统计
         try:
-            response = self.make_request('POST', f'/api/repositories/{self.test_repo_id}/track')
+            response = await self.make_request('POST', f'/api/repositories/{self.test_repo_id}/track')
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 self.log_test(
                     "仓库统计管理 - 加入统计", 
                     True, 
@@ -340,14 +494,15 @@ class YunxiaoRepositoryTester:
                     "仓库统计管理 - 加入统计", 
                     False, 
                     f"状态码: {response.status_code}",
-                    response.json() if response.content else response.text
+                    _safe_json(response)
                 )
         except Exception as e:
             self.log_test("仓库统计管理 - 加入统计", False, f"异常: {str(e)}")
         
         # 测试用例2: 重复加入统计
         try:
-            response = self.make_request('POST', f'/api/repositories/{self.test_repo_id}/track')
+            response = await self.make_request('POST', f'/api/repositories/{self.test_repo_id}/track',
+                                               expect_status_only=True)
             
             if response.status_code in [200, 409]:  # 可能返回200（已在统计中）或409（冲突）
                 self.log_test(
@@ -366,10 +521,10 @@ class YunxiaoRepositoryTester:
         
         # 测试用例3: 移出统计
         try:
-            response = self.make_request('POST', f'/api/repositories/{self.test_repo_id}/untrack')
+            response = await self.make_request('POST', f'/api/repositories/{self.test_repo_id}/untrack')
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 self.log_test(
                     "仓库统计管理 - 移出统计", 
                     True, 
@@ -381,15 +536,14 @@ class YunxiaoRepositoryTester:
                     "仓库统计管理 - 移出统计", 
                     False, 
                     f"状态码: {response.status_code}",
-                    response.json() if response.content else response.text
+                    _safe_json(response)
                 )
         except Exception as e:
             self.log_test("仓库统计管理 - 移出统计", False, f"异常: {str(e)}")
         
         # 测试用例4: 不存在的仓库ID
         try:
-            fake_repo_id = 999999
-            response = self.make_request('POST', f'/api/repositories/{fake_repo_id}/track')
+            response = await missing_track
             
             if response.status_code == 404:
                 self.log_test(
@@ -406,11 +560,149 @@ class YunxiaoRepositoryTester:
         except Exception as e:
             self.log_test("仓库统计管理 - 不存在仓库", False, f"异常: {str(e)}")
     
-    def test_conflict_handling(self):
+    async def test_commits_cursor_pagination(self):
+        """
+        测试提交记录的游标分页
+        """
+        self.emit("\n=== 提交记录游标分页测试 ===")
+        
+        if not self.access_token:
+            self.log_test("提交记录游标分页", False, "跳过测试 - 未登录")
+            return
+        
+        if not self.test_repo_id:
+            self.log_test("提交记录游标分页", False, "跳过测试 - 没有测试仓库ID")
+            return
+        
+        endpoint = f'/api/repositories/{self.test_repo_id}/commits'
+        
+        # 只传游标的一半应返回422，与第一页请求相互独立，并发发送
+        half_cursor = asyncio.create_task(self.make_request(
+            'GET', endpoint, params={'per_page': 1, 'before_id': 1}, expect_status_only=True
+        ))
+        
+        # 测试用例1: 按响应头中的游标依次获取前两页
+        try:
+            response = await self.make_request('GET', endpoint, params={'per_page': 1})
+            has_next = response.headers.get(_HAS_NEXT_HEADER)
+            
+            if response.status_code != 200 or has_next is None:
+                self.log_test(
+                    "提交记录游标分页 - 翻页",
+                    False,
+                    f"第一页状态码: {response.status_code}，{_HAS_NEXT_HEADER}: {has_next}",
+                    _safe_json(response)
+                )
+            elif has_next != 'true':
+                self.log_test(
+                    "提交记录游标分页 - 翻页",
+                    True,
+                    f"提交记录不足两条，只有一页（{_HAS_NEXT_HEADER}: {has_next}）"
+                )
+            else:
+                first_page = _json(response)
+                cursor = {
+                    'before_date': response.headers.get(_NEXT_BEFORE_DATE_HEADER),
+                    'before_id': response.headers.get(_NEXT_BEFORE_ID_HEADER)
+                }
+                response = await self.make_request('GET', endpoint, params={'per_page': 1, **cursor})
+                
+                if response.status_code == 200:
+                    second_page = _json(response)
+                    first_ids = [commit.get('id') for commit in first_page]
+                    second_ids = [commit.get('id') for commit in second_page]
+                    self.log_test(
+                        "提交记录游标分页 - 翻页",
+                        bool(second_ids) and not set(first_ids) & set(second_ids),
+                        f"第一页: {first_ids}，第二页: {second_ids}",
+                        cursor
+                    )
+                else:
+                    self.log_test(
+                        "提交记录游标分页 - 翻页",
+                        False,
+                        f"第二页状态码: {response.status_code}",
+                        _safe_json(response)
+                    )
+        except Exception as e:
+            self.log_test("提交记录游标分页 - 翻页", False, f"异常: {str(e)}")
+        
+        # 测试用例2: 游标不完整
+        try:
+            response = await half_cursor
+            
+            if response.status_code == 422:
+                self.log_test(
+                    "提交记录游标分页 - 游标不完整",
+                    True,
+                    "正确返回422错误"
+                )
+            else:
+                self.log_test(
+                    "提交记录游标分页 - 游标不完整",
+                    False,
+                    f"期望422错误，实际状态码: {response.status_code}"
+                )
+        except Exception as e:
+            self.log_test("提交记录游标分页 - 游标不完整", False, f"异常: {str(e)}")
+    
+    async def test_bulk_add_repositories(self):
+        """
+        测试批量添加仓库接口
+        """
+        self.emit("\n=== 批量添加仓库测试 ===")
+        
+        if not self.access_token:
+            self.log_test("批量添加仓库", False, "跳过测试 - 未登录")
+            return
+        
+        # 一个正常仓库、一个与之重复的仓库、一个URL无效的仓库，期望逐项返回201/409/400
+        ts = int(time.time())
+        valid_repo = {
+            'name': f'bulk-repo-{ts}',
+            'url': f'https://codeup.aliyun.com/test/bulk-repo-{ts}.git',
+            'platform': 'yunxiao',
+            'api_key': 'test-api-key'
+        }
+        invalid_repo = {**valid_repo, 'name': f'bulk-invalid-{ts}', 'url': f'ftp://codeup.aliyun.com/test/bulk-{ts}'}
+        expected_statuses = [201, 409, 400]
+        
+        try:
+            response = await self.add_repositories_bulk([valid_repo, valid_repo, invalid_repo])
+            
+            if response.status_code == 200:
+                data = _json(response)
+                statuses = [item.get('status') for item in data.get('items', [])]
+                created = data.get('created')
+                if statuses == expected_statuses and created == 1:
+                    self.log_test(
+                        "批量添加仓库 - 逐项结果",
+                        True,
+                        f"逐项状态: {statuses}，成功创建 {created} 个",
+                        data
+                    )
+                else:
+                    self.log_test(
+                        "批量添加仓库 - 逐项结果",
+                        False,
+                        f"期望逐项状态 {expected_statuses} 且创建1个，实际: {statuses}，创建 {created} 个",
+                        data
+                    )
+            else:
+                self.log_test(
+                    "批量添加仓库 - 逐项结果",
+                    False,
+                    f"状态码: {response.status_code}",
+                    _safe_json(response)
+                )
+        except Exception as e:
+            self.log_test("批量添加仓库 - 逐项结果", False, f"异常: {str(e)}")
+    
+    async def test_conflict_handling(self):
         """
         测试冲突处理逻辑
         """
-        print("\n=== 冲突处理测试 ===")
+        self.emit("\n=== 冲突处理测试 ===")
         
         if not self.access_token:
             self.log_test("冲突处理测试", False, "跳过测试 - 未登录")
@@ -427,14 +719,14 @@ class YunxiaoRepositoryTester:
         
         # 第一次添加
         try:
-            response1 = self.make_request('POST', '/api/repositories/yunxiao/add', data=conflict_repo_data)
+            response1 = await self.make_request('POST', '/api/repositories/yunxiao/add', data=conflict_repo_data)
             
             if response1.status_code == 201:
                 # 第二次添加相同仓库，应该返回409
-                response2 = self.make_request('POST', '/api/repositories/yunxiao/add', data=conflict_repo_data)
+                response2 = await self.make_request('POST', '/api/repositories/yunxiao/add', data=conflict_repo_data)
                 
                 if response2.status_code == 409:
-                    conflict_data = response2.json()
+                    conflict_data = _json(response2)
                     self.log_test(
                         "冲突处理测试 - 409响应", 
                         True, 
@@ -470,7 +762,7 @@ class YunxiaoRepositoryTester:
         except Exception as e:
             self.log_test("冲突处理测试", False, f"异常: {str(e)}")
     
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """
         运行所有测试
         """
@@ -478,16 +770,27 @@ class YunxiaoRepositoryTester:
         print("开始云效仓库接口测试")
         print("="*50)
         
+        # 先快速确认后端可用，避免在登录请求上等待超时
+        if not await self.check_health():
+            print("\n❌ 服务不可用，终止测试")
+            return
+        
         # 登录
-        if not self.login():
+        if not await self.login():
             print("\n❌ 登录失败，终止测试")
             return
         
-        # 运行各项测试
-        self.test_yunxiao_search()
-        self.test_yunxiao_add_repository()
-        self.test_repository_tracking()
-        self.test_conflict_handling()
+        # 统计管理和游标分页测试依赖添加测试创建的仓库，放在同一组内顺序执行；
+        # 各组之间相互独立，并发运行后按固定顺序输出
+        group_outputs = await asyncio.gather(
+            self.run_group(self.test_yunxiao_search),
+            self.run_group(self.test_yunxiao_add_repository, self.test_repository_tracking,
+                           self.test_commits_cursor_pagination),
+            self.run_group(self.test_conflict_handling),
+            self.run_group(self.test_bulk_add_repositories)
+        )
+        for lines in group_outputs:
+            print('\n'.join(lines))
         
         # 输出测试总结
         self.print_test_summary()
@@ -501,7 +804,7 @@ class YunxiaoRepositoryTester:
         print("="*50)
         
         total_tests = len(self.test_results)
-        passed_tests = len([r for r in self.test_results if r['success']])
+        passed_tests = len([r for r in self.test_results if r.success])
         failed_tests = total_tests - passed_tests
         
         print(f"总测试数: {total_tests}")
@@ -512,37 +815,43 @@ class YunxiaoRepositoryTester:
         if failed_tests > 0:
             print("\n失败的测试:")
             for result in self.test_results:
-                if not result['success']:
-                    print(f"  ❌ {result['test_name']}: {result['message']}")
+                if not result.success:
+                    print(f"  ❌ {result.test_name}: {result.message}")
         
         # 保存详细测试结果到文件
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"yunxiao_test_results_{timestamp}.json"
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'summary': {
-                        'total_tests': total_tests,
-                        'passed_tests': passed_tests,
-                        'failed_tests': failed_tests,
-                        'success_rate': f"{(passed_tests/total_tests*100):.1f}%" if total_tests > 0 else "0%"
-                    },
-                    'test_results': self.test_results
-                }, f, ensure_ascii=False, indent=2)
+            # 整体序列化后一次写入文件
+            Path(filename).write_bytes(orjson.dumps({
+                'summary': {
+                    'total_tests': total_tests,
+                    'passed_tests': passed_tests,
+                    'failed_tests': failed_tests,
+                    'success_rate': f"{(passed_tests/total_tests*100):.1f}%" if total_tests > 0 else "0%"
+                },
+                'test_results': [
+                    {
+                        **result._asdict(),
+                        'timestamp': (self._t0_wall + timedelta(microseconds=result.ts_ns // 1000)).isoformat()
+                    }
+                    for result in self.test_results
+                ]
+            }, option=_JSON_PRETTY_OPTIONS))
             
             print(f"\n详细测试结果已保存到: {filename}")
         except Exception as e:
             print(f"\n保存测试结果失败: {str(e)}")
 
 
-def main():
+async def main():
     """
     主函数
     """
-    tester = YunxiaoRepositoryTester()
-    tester.run_all_tests()
+    async with YunxiaoRepositoryTester() as tester:
+        await tester.run_all_tests()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file